@@ -0,0 +1,33 @@
+"""JSON codec shim — uses orjson when installed, stdlib json otherwise.
+
+orjson decodes straight from response bytes and encodes directly to UTF-8
+bytes in a single native pass, which matters for multi-megabyte card
+listings and manifests.  Install it with the ``fast`` extra; without it
+everything falls back to the stdlib codec.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+loads: Callable[[Union[bytes, str]], Any]
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Encode obj as 2-space-indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+else:  # pragma: no cover - depends on the installed extras
+    loads = json.loads
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Encode obj as 2-space-indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -10,8 +11,14 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+from card_scraper import _json
 from card_scraper.adapters import known_adapters
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_PATH = Path("config.yaml")
@@ -132,15 +139,26 @@ class AppConfig:
 
 
 def load_config(path: Optional[Path] = None, game: Optional[str] = None) -> AppConfig:
-    """Load configuration from a YAML file, falling back to defaults."""
+    """Load configuration from a YAML file, falling back to defaults.
+
+    The parsed YAML is cached in a ``.<name>.cache.json`` sidecar keyed on
+    the file's mtime and size, so repeat runs skip YAML parsing entirely.
+    """
     config_path = path or DEFAULT_CONFIG_PATH
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         logger.info("No config file at %s, using defaults", config_path)
         config = AppConfig()
     else:
         logger.info("Loading config from %s", config_path)
-        with open(config_path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        cache_path = config_path.with_name(f".{config_path.stem}.cache.json")
+        raw = _read_cached_raw(cache_path, st)
+        if raw is None:
+            with open(config_path, "r", encoding="utf-8") as f:
+                raw = yaml.load(f, Loader=_YamlLoader)
+            if raw:
+                _write_cached_raw(cache_path, st, raw)
         config = _parse_config(raw) if raw else AppConfig()
 
     # CLI game override
@@ -151,6 +169,43 @@ def load_config(path: Optional[Path] = None, game: Optional[str] = None) -> AppC
     return config
 
 
+def _read_cached_raw(cache_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached raw config dict if it matches the YAML file's stat."""
+    try:
+        cached = _json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("mtime_ns") != st.st_mtime_ns
+        or cached.get("size") != st.st_size
+    ):
+        return None
+    return cached.get("raw")
+
+
+def _write_cached_raw(cache_path: Path, st: os.stat_result, raw: Dict[str, Any]) -> None:
+    """Best-effort write of the config cache sidecar.
+
+    The config is only cached if it decodes back to exactly ``raw``:
+    JSON would turn YAML dates and non-string keys into strings, and a
+    cache hit must return the same dict as a fresh parse.
+    """
+    payload = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "raw": raw}
+    try:
+        encoded = _json.dumps_pretty(payload)
+    except TypeError as exc:
+        logger.debug("Not caching config %s: %s", cache_path, exc)
+        return
+    if _json.loads(encoded)["raw"] != raw:
+        logger.debug("Not caching config %s: it does not round-trip through JSON", cache_path)
+        return
+    try:
+        cache_path.write_bytes(encoded)
+    except OSError as exc:
+        logger.debug("Not caching config %s: %s", cache_path, exc)
+
+
 def _parse_config(raw: Dict[str, Any]) -> AppConfig:
     """Parse raw YAML dict into AppConfig."""
     config = AppConfig()
@@ -54,14 +54,13 @@ def parse_type_line(type_line: str) -> TypeLineResult:
         return TypeLineResult()
 
     # Multi-face: only parse the front face
-    if " // " in type_line:
-        type_line = type_line.split(" // ")[0]
+    type_line = type_line.partition(" // ")[0]
 
     # Split on em dash (—) to separate type part from subtype part
     # Scryfall uses the em dash character
-    parts = type_line.split("—", 1)
-    type_part = parts[0].strip()
-    subtype_part = parts[1].strip() if len(parts) > 1 else ""
+    type_part, _, subtype_part = type_line.partition("—")
+    type_part = type_part.strip()
+    subtype_part = subtype_part.strip()
 
     # Parse the type part: supertypes come before card types
     supertypes: List[str] = []
@@ -101,5 +100,10 @@ def parse_multi_face_type_lines(type_line: str) -> List[TypeLineResult]:
     if not type_line or not type_line.strip():
         return [TypeLineResult()]
 
-    faces = type_line.split(" // ")
-    return [parse_type_line(face.strip()) for face in faces]
+    results: List[TypeLineResult] = []
+    rest = type_line
+    while True:
+        face, sep, rest = rest.partition(" // ")
+        results.append(parse_type_line(face.strip()))
+        if not sep:
+            return results
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from typing import Any, Dict, List, Optional
 
 import httpx
 
+from card_scraper import _json
 from card_scraper.games.onepiece.models import OnePieceCardData
 from card_scraper.models import SetInfo
 
@@ -20,8 +22,13 @@ IMAGE_BASE = f"{BASE_URL}/media/static/Card_Images"
 class OptcgApiAdapter:
     """Primary adapter using optcgapi.com REST endpoints."""
 
-    def __init__(self, rate_limit_ms: int = 200) -> None:
+    def __init__(
+        self,
+        rate_limit_ms: int = 200,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         self._rate_limit = rate_limit_ms / 1000.0
+        self._transport = transport
         self._client: Optional[httpx.AsyncClient] = None
 
     @property
@@ -32,6 +39,7 @@ class OptcgApiAdapter:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=BASE_URL,
+                transport=self._transport,
                 timeout=30.0,
                 headers={"User-Agent": "ManaMesh-CardScraper/0.2"},
             )
@@ -46,7 +54,7 @@ class OptcgApiAdapter:
         await self._throttle()
         resp = await client.get(path)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def list_sets(self) -> List[SetInfo]:
         """Fetch all booster sets from /api/allSets/."""
@@ -126,13 +134,15 @@ class OptcgApiAdapter:
     def _parse_card(self, raw: Dict[str, Any], default_set_id: str) -> OnePieceCardData:
         card_id = str(raw.get("card_set_id", raw.get("id", "")))
         color_raw = str(raw.get("card_color", raw.get("color", "")))
-        colors = [c.strip() for c in color_raw.split("/") if c.strip()] if color_raw else []
+        colors = _split_interned(color_raw) if color_raw else []
 
+        # Colors, traits, rarities and card types repeat across nearly every
+        # card in a set, so intern them to share one string object per value.
         traits_raw = raw.get("sub_types", raw.get("traits", ""))
         if isinstance(traits_raw, str):
-            traits = [t.strip() for t in traits_raw.split("/") if t.strip()]
+            traits = _split_interned(traits_raw)
         elif isinstance(traits_raw, list):
-            traits = traits_raw
+            traits = [sys.intern(str(t)) for t in traits_raw]
         else:
             traits = []
 
@@ -143,12 +153,12 @@ class OptcgApiAdapter:
         return OnePieceCardData(
             id=card_id,
             name=str(raw.get("card_name", raw.get("name", ""))),
-            card_type=str(raw.get("card_type", raw.get("type", ""))).lower(),
+            card_type=sys.intern(str(raw.get("card_type", raw.get("type", ""))).lower()),
             cost=_int_or_none(raw.get("card_cost", raw.get("cost"))),
             power=_int_or_none(raw.get("card_power", raw.get("power"))),
             counter=_int_or_none(raw.get("counter_amount", raw.get("counter"))),
             colors=colors,
-            rarity=str(raw.get("rarity", "")),
+            rarity=sys.intern(str(raw.get("rarity", ""))),
             traits=traits,
             text=str(raw.get("card_text", raw.get("text", ""))),
             life=_int_or_none(raw.get("life")),
@@ -163,6 +173,11 @@ class OptcgApiAdapter:
         return parts[0] if parts else card_id
 
 
+def _split_interned(value: str) -> List[str]:
+    """Split a slash-separated field ("Red/Green") into interned, stripped parts."""
+    return [sys.intern(part) for part in (p.strip() for p in value.split("/")) if part]
+
+
 def _int_or_none(val: Any) -> Optional[int]:
     if val is None or val == "" or val == "null":
         return None
@@ -4,24 +4,35 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
 import httpx
 
+from card_scraper import _json
 from card_scraper.games.onepiece.models import OnePieceCardData
 from card_scraper.models import SetInfo
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://optcg-api.com"
+PER_PAGE = 100
+PAGE_WINDOW = 4  # pages fetched concurrently once a set spans more than one page
 
 
 class RyanApiAdapter:
     """Secondary adapter using the ryanmichaelhirst OPTCG API."""
 
-    def __init__(self, rate_limit_ms: int = 500) -> None:
+    def __init__(
+        self,
+        rate_limit_ms: int = 500,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         self._rate_limit = rate_limit_ms / 1000.0
+        self._transport = transport
         self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(PAGE_WINDOW)
+        self._next_slot = 0.0
 
     @property
     def name(self) -> str:
@@ -31,21 +42,32 @@ class RyanApiAdapter:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=BASE_URL,
+                transport=self._transport,
                 timeout=30.0,
                 headers={"User-Agent": "ManaMesh-CardScraper/0.2"},
             )
         return self._client
 
     async def _throttle(self) -> None:
-        if self._rate_limit > 0:
-            await asyncio.sleep(self._rate_limit)
+        # Each request reserves the next free slot, so windowed page
+        # fetches still start at most once per rate_limit; only their
+        # round-trips overlap.  No await between reading and updating
+        # the slot, so concurrent pages can't claim the same one.
+        if self._rate_limit <= 0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._rate_limit
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         client = self._get_client()
-        await self._throttle()
-        resp = await client.get(path, params=params)
+        async with self._semaphore:
+            await self._throttle()
+            resp = await client.get(path, params=params)
         resp.raise_for_status()
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def list_sets(self) -> List[SetInfo]:
         """Derive set list from paginated card data."""
@@ -65,29 +87,31 @@ class RyanApiAdapter:
         return sets
 
     async def get_cards(self, set_id: str) -> List[OnePieceCardData]:
-        """Fetch all cards for a set, handling pagination."""
-        all_cards: List[OnePieceCardData] = []
-        page = 1
-        per_page = 100
+        """Fetch all cards for a set, handling pagination.
 
-        while True:
-            data = await self._get_json(
-                "/api/v1/cards",
-                params={"set": set_id, "per_page": per_page, "page": page},
+        Page 1 is fetched alone; if it comes back full, the following
+        pages are requested PAGE_WINDOW at a time until a short page
+        marks the end of the set.
+        """
+        all_cards: List[OnePieceCardData] = []
+        cards_list = await self._fetch_page(set_id, 1)
+        self._parse_page(cards_list, set_id, all_cards)
+
+        page = 2
+        while len(cards_list) == PER_PAGE:
+            results = await asyncio.gather(
+                *(self._fetch_page(set_id, p) for p in range(page, page + PAGE_WINDOW)),
+                return_exceptions=True,
             )
-            cards_list = data if isinstance(data, list) else data.get("data", data.get("cards", []))
-            if not cards_list:
-                break
-
-            for raw in cards_list:
-                try:
-                    all_cards.append(self._parse_card(raw, set_id))
-                except Exception:
-                    logger.warning("Ryan API: failed to parse card: %s", raw.get("code", "?"))
-
-            if len(cards_list) < per_page:
-                break
-            page += 1
+            # Pages after the first short one are discarded, errors included
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+                cards_list = result
+                self._parse_page(cards_list, set_id, all_cards)
+                if len(cards_list) < PER_PAGE:
+                    break
+            page += PAGE_WINDOW
 
         logger.info("Ryan API: set %s -> %d cards", set_id, len(all_cards))
         return all_cards
@@ -99,6 +123,22 @@ class RyanApiAdapter:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def _fetch_page(self, set_id: str, page: int) -> List[Dict[str, Any]]:
+        data = await self._get_json(
+            "/api/v1/cards",
+            params={"set": set_id, "per_page": PER_PAGE, "page": page},
+        )
+        return data if isinstance(data, list) else data.get("data", data.get("cards", []))
+
+    def _parse_page(
+        self, cards_list: List[Dict[str, Any]], set_id: str, out: List[OnePieceCardData]
+    ) -> None:
+        for raw in cards_list:
+            try:
+                out.append(self._parse_card(raw, set_id))
+            except Exception:
+                logger.warning("Ryan API: failed to parse card: %s", raw.get("code", "?"))
+
     def _parse_card(self, raw: Dict[str, Any], default_set_id: str) -> OnePieceCardData:
         card_id = str(raw.get("code", raw.get("id", "")))
         color_raw = str(raw.get("color", ""))
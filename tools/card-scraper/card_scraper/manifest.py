@@ -6,23 +6,38 @@ game packages (games/onepiece/manifest_template.py, etc.).
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List
 
+from card_scraper import _json
 from card_scraper.models import CardDataBase, SetInfo
 
 logger = logging.getLogger(__name__)
 
 
 def write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
-    """Write a manifest dict to a JSON file."""
+    """Write a manifest dict to a JSON file.
+
+    The encoded bytes go straight to a raw file descriptor (no text
+    layer) in a sibling ``.tmp`` file, which is then renamed over the
+    target so readers never see a half-written manifest.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    view = memoryview(_json.dumps_pretty(manifest))
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def generate_root_manifest(
@@ -7,12 +7,14 @@ game packages (e.g., games/onepiece/models.py, games/mtg/models.py).
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-@dataclass
-class SetInfo:
-    """Metadata about a card set / expansion."""
+class SetInfo(NamedTuple):
+    """Metadata about a card set / expansion.
+
+    Immutable once built by an adapter, so a plain tuple is enough.
+    """
 
     id: str  # e.g. "OP-01", "MKM"
     name: str  # e.g. "Romance Dawn", "Murders at Karlov Manor"
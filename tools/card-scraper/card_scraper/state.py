@@ -33,17 +33,18 @@ class StateTracker:
         """Persist current state to disk."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
         data = _serialize_state(self.state)
-        self._path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        self._path.write_bytes(
+            json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
         )
         logger.debug("State saved to %s", self._path)
 
     def delete(self) -> None:
         """Remove the state file."""
-        if self._path.exists():
+        try:
             self._path.unlink()
             logger.info("Deleted state file %s", self._path)
+        except FileNotFoundError:
+            pass
         self._state = ScrapeState()
 
     def summary(self) -> Dict[str, Any]:
@@ -83,14 +84,16 @@ class StateTracker:
     # ------------------------------------------------------------------
 
     def _load(self) -> ScrapeState:
-        if not self._path.exists():
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
             logger.info("No state file at %s, starting fresh", self._path)
             return ScrapeState()
 
         try:
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            raw = json.loads(data)
             return _deserialize_state(raw)
-        except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as exc:
             logger.warning("Corrupt state file %s: %s — starting fresh", self._path, exc)
             return ScrapeState()
 
@@ -0,0 +1,30 @@
+"""Shared fixtures for the One Piece adapter tests."""
+
+import httpx
+import pytest
+
+
+def _handler(routes):
+    """Build a MockTransport handler that serves JSON payloads by URL path.
+
+    A route may map to a payload or to a callable taking the request.
+    """
+    def handle(request: httpx.Request) -> httpx.Response:
+        payload = routes.get(request.url.path)
+        if payload is None:
+            return httpx.Response(404)
+        if callable(payload):
+            payload = payload(request)
+        return httpx.Response(200, json=payload)
+    return handle
+
+
+@pytest.fixture
+def routes():
+    return {}
+
+
+@pytest.fixture
+def transport(routes):
+    """A mock transport serving ``routes``; pass it to an adapter."""
+    return httpx.MockTransport(_handler(routes))
@@ -1,23 +1,20 @@
 """Tests for the OPTCG API adapter."""
 
 import pytest
-import respx
-import httpx
 
 from card_scraper.games.onepiece.adapters.optcg_api import OptcgApiAdapter
 
 
 @pytest.fixture
-def adapter():
-    return OptcgApiAdapter(rate_limit_ms=0)
+def adapter(transport):
+    return OptcgApiAdapter(rate_limit_ms=0, transport=transport)
 
 
-@respx.mock(base_url="https://optcgapi.com")
-async def test_list_sets(respx_mock, adapter):
-    respx_mock.get("/api/allSets/").mock(return_value=httpx.Response(200, json=[
+async def test_list_sets(routes, adapter):
+    routes["/api/allSets/"] = [
         {"id": "OP-01", "name": "Romance Dawn"},
         {"id": "OP-02", "name": "Paramount War"},
-    ]))
+    ]
     sets = await adapter.list_sets()
     assert len(sets) == 2
     assert sets[0].id == "OP-01"
@@ -25,9 +22,8 @@ async def test_list_sets(respx_mock, adapter):
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcgapi.com")
-async def test_get_cards(respx_mock, adapter):
-    respx_mock.get("/api/sets/OP-01/").mock(return_value=httpx.Response(200, json=[
+async def test_get_cards(routes, adapter):
+    routes["/api/sets/OP-01/"] = [
         {
             "card_set_id": "OP01-001",
             "card_name": "Roronoa Zoro",
@@ -41,7 +37,7 @@ async def test_get_cards(respx_mock, adapter):
             "card_text": "Rush",
             "card_image": "/media/static/Card_Images/OP01-001.jpg",
         },
-    ]))
+    ]
     cards = await adapter.get_cards("OP-01")
     assert len(cards) == 1
     assert cards[0].id == "OP01-001"
@@ -51,9 +47,8 @@ async def test_get_cards(respx_mock, adapter):
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcgapi.com")
-async def test_get_cards_multicolor(respx_mock, adapter):
-    respx_mock.get("/api/sets/OP-01/").mock(return_value=httpx.Response(200, json=[
+async def test_get_cards_multicolor(routes, adapter):
+    routes["/api/sets/OP-01/"] = [
         {
             "card_set_id": "OP01-100",
             "card_name": "Multi Card",
@@ -61,29 +56,40 @@ async def test_get_cards_multicolor(respx_mock, adapter):
             "card_color": "Red/Green",
             "rarity": "C",
         },
-    ]))
+    ]
     cards = await adapter.get_cards("OP-01")
     assert cards[0].colors == ["Red", "Green"]
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcgapi.com")
-async def test_get_promo_cards(respx_mock, adapter):
-    respx_mock.get("/api/allPromoCards/").mock(return_value=httpx.Response(200, json=[
+async def test_get_cards_shares_trait_strings(routes, adapter):
+    routes["/api/sets/OP-01/"] = [
+        {"card_set_id": "OP01-001", "card_name": "Zoro", "card_type": "Character",
+         "card_color": "Red", "rarity": "SR", "sub_types": "Supernovas/Straw Hat Crew"},
+        {"card_set_id": "OP01-002", "card_name": "Luffy", "card_type": "Character",
+         "card_color": "Red", "rarity": "SR", "sub_types": "Straw Hat Crew"},
+    ]
+    cards = await adapter.get_cards("OP-01")
+    assert cards[0].traits[1] is cards[1].traits[0]
+    assert cards[0].colors[0] is cards[1].colors[0]
+    await adapter.close()
+
+
+async def test_get_promo_cards(routes, adapter):
+    routes["/api/allPromoCards/"] = [
         {"card_set_id": "P-001", "card_name": "Promo Card", "card_type": "Character", "rarity": "P"},
-    ]))
+    ]
     cards = await adapter.get_cards("PROMO")
     assert len(cards) == 1
     assert cards[0].id == "P-001"
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcgapi.com")
-async def test_get_starter_cards(respx_mock, adapter):
-    respx_mock.get("/api/allSTCards/").mock(return_value=httpx.Response(200, json=[
+async def test_get_starter_cards(routes, adapter):
+    routes["/api/allSTCards/"] = [
         {"card_set_id": "ST01-001", "card_name": "Starter 1", "card_type": "Character", "rarity": "C"},
         {"card_set_id": "ST02-001", "card_name": "Other Set", "card_type": "Character", "rarity": "C"},
-    ]))
+    ]
     cards = await adapter.get_cards("ST-01")
     assert len(cards) == 1
     assert cards[0].id == "ST01-001"
@@ -1,45 +1,42 @@
 """Tests for the Ryan API adapter."""
 
+import time
+
 import pytest
-import respx
-import httpx
 
 from card_scraper.games.onepiece.adapters.ryan_api import RyanApiAdapter
 
 
 @pytest.fixture
-def adapter():
-    return RyanApiAdapter(rate_limit_ms=0)
+def adapter(transport):
+    return RyanApiAdapter(rate_limit_ms=0, transport=transport)
 
 
-@respx.mock(base_url="https://optcg-api.com")
-async def test_list_sets(respx_mock, adapter):
-    respx_mock.get("/api/v1/cards").mock(return_value=httpx.Response(200, json={
+async def test_list_sets(routes, adapter):
+    routes["/api/v1/cards"] = {
         "data": [
             {"code": "OP01-001", "set": "OP01", "name": "Card 1"},
             {"code": "OP02-001", "set": "OP02", "name": "Card 2"},
         ]
-    }))
+    }
     sets = await adapter.list_sets()
     assert len(sets) == 2
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcg-api.com")
-async def test_get_cards(respx_mock, adapter):
-    respx_mock.get("/api/v1/cards").mock(return_value=httpx.Response(200, json={
+async def test_get_cards(routes, adapter):
+    routes["/api/v1/cards"] = {
         "data": [
             {"code": "OP01-001", "name": "Zoro", "type": "Character", "rarity": "SR"},
         ]
-    }))
+    }
     cards = await adapter.get_cards("OP01")
     assert len(cards) == 1
     assert cards[0].name == "Zoro"
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcg-api.com")
-async def test_get_cards_pagination(respx_mock, adapter):
+async def test_get_cards_pagination(routes, adapter):
     # Page 1: full page (100 items)
     page1 = [{"code": f"OP01-{i:03d}", "name": f"Card {i}", "type": "Character", "rarity": "C"}
              for i in range(100)]
@@ -47,25 +44,54 @@ async def test_get_cards_pagination(respx_mock, adapter):
     page2 = [{"code": f"OP01-{i:03d}", "name": f"Card {i}", "type": "Character", "rarity": "C"}
              for i in range(100, 102)]
 
-    call_count = 0
-
-    def side_effect(request):
-        nonlocal call_count
-        call_count += 1
+    def by_page(request):
         page = int(request.url.params.get("page", "1"))
-        if page == 1:
-            return httpx.Response(200, json={"data": page1})
-        return httpx.Response(200, json={"data": page2})
+        return {"data": page1 if page == 1 else page2}
 
-    respx_mock.get("/api/v1/cards").mock(side_effect=side_effect)
+    routes["/api/v1/cards"] = by_page
     cards = await adapter.get_cards("OP01")
     assert len(cards) == 102
     await adapter.close()
 
 
-@respx.mock(base_url="https://optcg-api.com")
-async def test_get_cards_empty(respx_mock, adapter):
-    respx_mock.get("/api/v1/cards").mock(return_value=httpx.Response(200, json={"data": []}))
+async def test_get_cards_pagination_across_windows(routes, adapter):
+    # Six full pages then a partial one; pages past the end come back empty
+    total = 6 * 100 + 7
+
+    def by_page(request):
+        page = int(request.url.params.get("page", "1"))
+        start = (page - 1) * 100
+        return {"data": [{"code": f"OP01-{i:03d}", "name": f"Card {i}", "type": "Character"}
+                         for i in range(start, min(start + 100, total))]}
+
+    routes["/api/v1/cards"] = by_page
+    cards = await adapter.get_cards("OP01")
+    assert len(cards) == total
+    assert [c.id for c in cards] == [f"OP01-{i:03d}" for i in range(total)]
+    await adapter.close()
+
+
+async def test_windowed_pages_respect_rate_limit(routes, transport):
+    adapter = RyanApiAdapter(rate_limit_ms=50, transport=transport)
+    sent = []
+
+    def by_page(request):
+        sent.append(time.monotonic())
+        page = int(request.url.params.get("page", "1"))
+        count = 100 if page < 4 else 0
+        return {"data": [{"code": f"OP01-{page}{i:03d}", "name": "C"} for i in range(count)]}
+
+    routes["/api/v1/cards"] = by_page
+    cards = await adapter.get_cards("OP01")
+    assert len(cards) == 300
+    assert len(sent) == 5  # page 1, then a window of pages 2-5
+    gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+    assert min(gaps) >= 0.045
+    await adapter.close()
+
+
+async def test_get_cards_empty(routes, adapter):
+    routes["/api/v1/cards"] = {"data": []}
     cards = await adapter.get_cards("EMPTY")
     assert len(cards) == 0
     await adapter.close()
@@ -1,5 +1,7 @@
 """Tests for multi-game configuration."""
 
+import json
+
 import pytest
 import yaml
 from pathlib import Path
@@ -150,6 +152,27 @@ def test_load_config_from_file(tmp_path):
     assert len(config.enabled_sources) == 1
 
 
+def test_load_config_uses_sidecar_cache(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({
+        "games": {"onepiece": {"sources": [{"name": "optcg-api", "rate_limit_ms": 300}]}},
+    }))
+    load_config(config_path)
+    cache_path = tmp_path / ".config.cache.json"
+    cached = json.loads(cache_path.read_text())
+
+    # A matching cache entry is used instead of re-parsing the YAML
+    cached["raw"]["games"]["onepiece"]["sources"][0]["rate_limit_ms"] = 999
+    cache_path.write_text(json.dumps(cached))
+    assert load_config(config_path).enabled_sources[0].rate_limit_ms == 999
+
+    # Editing the YAML invalidates it
+    config_path.write_text(yaml.dump({
+        "games": {"onepiece": {"sources": [{"name": "optcg-api", "rate_limit_ms": 4500}]}},
+    }))
+    assert load_config(config_path).enabled_sources[0].rate_limit_ms == 4500
+
+
 def test_load_config_game_override(tmp_path):
     """CLI --game flag should override config default."""
     config_path = tmp_path / "config.yaml"
@@ -167,3 +190,14 @@ def test_load_config_game_override(tmp_path):
     config = load_config(config_path, game="mtg")
     assert config.game == "mtg"
     assert config.enabled_sources[0].name == "scryfall-bulk"
+
+
+def test_load_config_skips_cache_that_would_not_round_trip(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "games:\n  onepiece:\n    sources:\n      - name: optcg-api\n"
+        "updated: 2024-01-01\n"
+    )
+    config = load_config(config_path)
+    assert config.enabled_sources[0].name == "optcg-api"
+    assert not (tmp_path / ".config.cache.json").exists()
@@ -2,7 +2,10 @@
 
 import json
 
-from card_scraper.manifest import generate_root_manifest, validate_manifest
+import pytest
+
+from card_scraper import manifest as manifest_mod
+from card_scraper.manifest import generate_root_manifest, validate_manifest, write_manifest
 from card_scraper.games.onepiece.manifest_template import (
     generate_onepiece_root_manifest,
     generate_onepiece_set_manifest,
@@ -77,6 +80,28 @@ def test_generate_set_manifest_leader(tmp_path):
     assert "cost" not in meta
 
 
+def test_write_manifest_replaces_atomically(tmp_path):
+    path = tmp_path / "OP-01" / "manifest.json"
+    write_manifest(path, {"name": "Old"})
+    write_manifest(path, {"name": "Ōnepiece – Neue"})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"name": "Ōnepiece – Neue"}
+    assert [p.name for p in path.parent.iterdir()] == ["manifest.json"]
+
+
+def test_write_manifest_failure_removes_tmp(tmp_path, monkeypatch):
+    path = tmp_path / "OP-01" / "manifest.json"
+    write_manifest(path, {"name": "Old"})
+
+    def fail(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manifest_mod.os, "write", fail)
+    with pytest.raises(OSError, match="disk full"):
+        write_manifest(path, {"name": "New"})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"name": "Old"}
+    assert [p.name for p in path.parent.iterdir()] == ["manifest.json"]
+
+
 def test_validate_manifest_valid():
     manifest = {
         "name": "Test Pack",
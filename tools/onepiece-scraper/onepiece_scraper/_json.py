@@ -0,0 +1,73 @@
+"""JSON codec shim — uses orjson when installed, stdlib json otherwise.
+
+orjson decodes straight from response bytes and encodes directly to UTF-8
+bytes in a single native pass, which matters for multi-megabyte card
+listings and manifests.  Install it with the ``fast`` extra; without it
+everything falls back to the stdlib codec.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+loads: Callable[[Union[bytes, str]], Any]
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Encode obj as 2-space-indented UTF-8 JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+else:  # pragma: no cover - depends on the installed extras
+    loads = json.loads
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Encode obj as 2-space-indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_file(path: Path, obj: Any, fsync: bool = False) -> None:
+    """Write obj to path as pretty JSON, atomically.
+
+    The encoded bytes go straight to a raw file descriptor in a sibling
+    ``.tmp`` file, which is then renamed over the target so readers never
+    see a half-written file.  With ``fsync`` the data is flushed to disk
+    before the rename, so the new file also survives a crash.
+    """
+    view = memoryview(dumps_pretty(obj))
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Bodies above this size are decoded in a worker thread rather than on the
+# event loop thread; below it the thread hand-off costs more than it saves.
+OFFLOAD_THRESHOLD = 65536
+
+
+async def loads_async(data: bytes) -> Any:
+    """Decode a response body, off the event loop thread when it is large."""
+    if len(data) > OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(loads, data)
+    return loads(data)
@@ -0,0 +1,20 @@
+"""URL helpers shared by the downloader and manifest generator."""
+
+from __future__ import annotations
+
+import functools
+import re
+
+# Known image extension at the end of the URL path (before any query or
+# fragment).  Anchored so an extension appearing only in the query string
+# is ignored.
+_EXT_RE = re.compile(r"[^?#]*\.(jpg|jpeg|png|webp|gif)(?:[?#]|$)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8192)
+def url_extension(url: str) -> str:
+    """Extract the image file extension from a URL, defaulting to jpg."""
+    if not url:
+        return "jpg"
+    m = _EXT_RE.match(url)
+    return m.group(1).lower() if m else "jpg"
@@ -2,27 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Dict, Type
+import importlib
+from typing import Dict, FrozenSet, Type
 
 from onepiece_scraper.adapters.base import CardSourceAdapter
 
-# Lazy-loaded adapter registry: name -> module.ClassName
-_ADAPTER_CLASSES: Dict[str, str] = {
-    "optcg-api": "onepiece_scraper.adapters.optcg_api.OptcgApiAdapter",
-    "ryan-api": "onepiece_scraper.adapters.ryan_api.RyanApiAdapter",
-    "vegapull-records": "onepiece_scraper.adapters.vegapull_records.VegapullRecordsAdapter",
+# Adapter registry: name -> "module:Class".  Modules are imported on first
+# lookup, so a run only loads the adapters its config enables.
+_ADAPTER_PATHS: Dict[str, str] = {
+    "optcg-api": "onepiece_scraper.adapters.optcg_api:OptcgApiAdapter",
+    "ryan-api": "onepiece_scraper.adapters.ryan_api:RyanApiAdapter",
+    "vegapull-records": "onepiece_scraper.adapters.vegapull_records:VegapullRecordsAdapter",
 }
 
 
+def available_sources() -> FrozenSet[str]:
+    """Names of all registered adapters, without importing any of them."""
+    return frozenset(_ADAPTER_PATHS)
+
+
 def get_adapter_class(name: str) -> Type[CardSourceAdapter]:
-    """Import and return the adapter class for the given source name."""
-    qualified = _ADAPTER_CLASSES.get(name)
-    if qualified is None:
+    """Return the adapter class for the given source name."""
+    try:
+        path = _ADAPTER_PATHS[name]
+    except KeyError:
         raise ValueError(
-            f"Unknown adapter '{name}'. Available: {list(_ADAPTER_CLASSES.keys())}"
-        )
-    module_path, class_name = qualified.rsplit(".", 1)
-    import importlib
-
-    module = importlib.import_module(module_path)
-    return getattr(module, class_name)
+            f"Unknown adapter '{name}'. Available: {list(_ADAPTER_PATHS.keys())}"
+        ) from None
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,96 @@
+"""Table-driven field extraction shared by the API adapters.
+
+Each adapter describes how raw JSON keys map onto CardData attributes as
+a tuple of ``(attr, key, fallback_key, default, convert)`` rows built once
+at import time.  ``extract_fields`` walks that table per card, which keeps
+the hot parsing loop to one pass with local bindings instead of a
+hand-written nested ``raw.get`` for every attribute.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+
+FieldSpec = Tuple[str, str, Optional[str], Any, Callable[[Any], Any]]
+
+
+def extract_fields(raw: Dict[str, Any], fields: Tuple[FieldSpec, ...]) -> Dict[str, Any]:
+    """Build CardData keyword arguments from a raw dict using a field table.
+
+    Equivalent to ``convert(raw.get(key, raw.get(fallback_key, default)))``
+    per row; a ``None`` fallback key simply yields the default.
+    """
+    get = raw.get
+    return {
+        attr: convert(get(key, get(fallback, default)))
+        for attr, key, fallback, default, convert in fields
+    }
+
+
+ChainSpec = Tuple[str, Tuple[str, ...], Any, Callable[[Any], Any]]
+
+
+def extract_chained(raw: Dict[str, Any], fields: Tuple[ChainSpec, ...]) -> Dict[str, Any]:
+    """Like ``extract_fields`` for rows of ``(attr, keys, default, convert)``.
+
+    The first of ``keys`` present in ``raw`` wins, matching a nested
+    ``raw.get`` chain of any depth.
+    """
+    out = {}
+    for attr, keys, default, convert in fields:
+        value = default
+        for key in keys:
+            if key in raw:
+                value = raw[key]
+                break
+        out[attr] = convert(value)
+    return out
+
+
+def int_or_none(val: Any) -> Optional[int]:
+    if val is None or val == "" or val == "null":
+        return None
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def interned_str(val: Any) -> str:
+    """str() for low-cardinality values (IDs, rarities) shared across cards."""
+    return sys.intern(str(val))
+
+
+def interned_lower(val: Any) -> str:
+    return sys.intern(str(val).lower())
+
+
+# Colors and trait lists repeat across thousands of cards, so parsed
+# values are pooled: every card with the same traits shares one tuple of
+# interned strings.
+_TUPLE_POOL: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _pooled(parts: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _TUPLE_POOL.setdefault(parts, parts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_pooled(text: str) -> Tuple[str, ...]:
+    return _pooled(tuple(sys.intern(part.strip()) for part in text.split("/") if part.strip()))
+
+
+def split_slash(val: Any) -> Tuple[str, ...]:
+    """Split a "Red/Green"-style value into stripped, non-empty parts."""
+    return _split_pooled(str(val))
+
+
+def split_traits(val: Any) -> Tuple[str, ...]:
+    """Traits arrive either as a "/"-separated string or as a list."""
+    if isinstance(val, str):
+        return split_slash(val)
+    if isinstance(val, list):
+        return _pooled(tuple(sys.intern(str(trait)) for trait in val))
+    return ()
@@ -34,5 +34,10 @@ class CardSourceAdapter(Protocol):
         ...
 
     async def close(self) -> None:
-        """Clean up any resources (HTTP clients, etc.)."""
+        """Clean up any per-adapter resources.
+
+        The HTTP client is shared (see ``onepiece_scraper.http``) and is
+        not closed here; callers using adapters outside the scraper must
+        call ``close_shared_client()`` when done.
+        """
         ...
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
-
-import httpx
-
+import sys
+from typing import Any, Dict, List
+
+from onepiece_scraper import _json
+from onepiece_scraper.adapters._fields import (
+    extract_fields,
+    int_or_none,
+    interned_lower,
+    interned_str,
+    split_slash,
+    split_traits,
+)
+from onepiece_scraper.http import RateLimiter, shared_client
 from onepiece_scraper.models import CardData, SetInfo
 
 logger = logging.getLogger(__name__)
@@ -15,6 +24,22 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://optcgapi.com"
 IMAGE_BASE = f"{BASE_URL}/media/static/Card_Images"
 
+# (attr, key, fallback_key, default, convert) — see adapters._fields
+_OPTCG_FIELDS = (
+    ("id", "card_set_id", "id", "", interned_str),
+    ("name", "card_name", "name", "", str),
+    ("card_type", "card_type", "type", "", interned_lower),
+    ("cost", "card_cost", "cost", None, int_or_none),
+    ("power", "card_power", "power", None, int_or_none),
+    ("counter", "counter_amount", "counter", None, int_or_none),
+    ("colors", "card_color", "color", "", split_slash),
+    ("rarity", "rarity", None, "", interned_str),
+    ("traits", "sub_types", "traits", "", split_traits),
+    ("text", "card_text", "text", "", str),
+    ("life", "life", None, None, int_or_none),
+    ("image_url", "card_image", None, "", str),
+)
+
 
 class OptcgApiAdapter:
     """Primary adapter using optcgapi.com REST endpoints.
@@ -27,32 +52,18 @@ class OptcgApiAdapter:
     """
 
     def __init__(self, rate_limit_ms: int = 200) -> None:
-        self._rate_limit = rate_limit_ms / 1000.0
-        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter = RateLimiter(rate_limit_ms / 1000.0)
 
     @property
     def name(self) -> str:
         return "optcg-api"
 
-    def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=BASE_URL,
-                timeout=30.0,
-                headers={"User-Agent": "ManaMesh-OnePieceScraper/0.1"},
-            )
-        return self._client
-
-    async def _throttle(self) -> None:
-        if self._rate_limit > 0:
-            await asyncio.sleep(self._rate_limit)
-
     async def _get_json(self, path: str) -> Any:
-        client = self._get_client()
-        await self._throttle()
-        resp = await client.get(path)
+        client = shared_client()
+        async with self._limiter:
+            resp = await client.get(f"{BASE_URL}{path}")
         resp.raise_for_status()
-        return resp.json()
+        return await _json.loads_async(resp.content)
 
     # ------------------------------------------------------------------
     # Public interface
@@ -91,11 +102,13 @@ class OptcgApiAdapter:
         """Build image URL from card ID."""
         if card.image_url and card.image_url.startswith("http"):
             return card.image_url
-        return f"{IMAGE_BASE}/{card.id}.jpg"
+        return _image_url_for_id(card.id)
 
     async def close(self) -> None:
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        # The HTTP client is shared and left open: the scraper closes it at
+        # teardown, standalone callers with close_shared_client().
+        _image_url_for_id.cache_clear()
+        self._normalize_set_id.cache_clear()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -111,7 +124,8 @@ class OptcgApiAdapter:
         data = await self._get_json("/api/allSTCards/")
         all_cards = self._parse_card_list(data, set_id)
         # Filter to the requested starter set
-        cards = [c for c in all_cards if self._normalize_set_id(c.id).upper().startswith(set_id.upper())]
+        prefix = set_id.upper()
+        cards = [c for c in all_cards if self._normalize_set_id(c.id).upper().startswith(prefix)]
         logger.info("OPTCG API: starter %s -> %d cards", set_id, len(cards))
         return cards
 
@@ -138,50 +152,23 @@ class OptcgApiAdapter:
         return cards
 
     def _parse_card(self, raw: Dict[str, Any], default_set_id: str) -> CardData:
-        card_id = str(raw.get("card_set_id", raw.get("id", "")))
-        color_raw = str(raw.get("card_color", raw.get("color", "")))
-        colors = [c.strip() for c in color_raw.split("/") if c.strip()] if color_raw else []
-
-        traits_raw = raw.get("sub_types", raw.get("traits", ""))
-        if isinstance(traits_raw, str):
-            traits = [t.strip() for t in traits_raw.split("/") if t.strip()]
-        elif isinstance(traits_raw, list):
-            traits = traits_raw
-        else:
-            traits = []
-
-        image_url = str(raw.get("card_image", ""))
+        fields = extract_fields(raw, _OPTCG_FIELDS)
+        image_url = fields["image_url"]
         if image_url and not image_url.startswith("http"):
-            image_url = f"{BASE_URL}{image_url}" if image_url.startswith("/") else f"{IMAGE_BASE}/{image_url}"
-
-        return CardData(
-            id=card_id,
-            name=str(raw.get("card_name", raw.get("name", ""))),
-            card_type=str(raw.get("card_type", raw.get("type", ""))).lower(),
-            cost=_int_or_none(raw.get("card_cost", raw.get("cost"))),
-            power=_int_or_none(raw.get("card_power", raw.get("power"))),
-            counter=_int_or_none(raw.get("counter_amount", raw.get("counter"))),
-            colors=colors,
-            rarity=str(raw.get("rarity", "")),
-            traits=traits,
-            text=str(raw.get("card_text", raw.get("text", ""))),
-            life=_int_or_none(raw.get("life")),
-            image_url=image_url,
-            set_id=default_set_id,
-            source=self.name,
-        )
+            fields["image_url"] = (
+                f"{BASE_URL}{image_url}" if image_url.startswith("/") else f"{IMAGE_BASE}/{image_url}"
+            )
+        return CardData(**fields, set_id=sys.intern(default_set_id), source=self.name)
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _normalize_set_id(card_id: str) -> str:
         """Extract set prefix from a card ID like 'OP01-001' -> 'OP01'."""
         parts = card_id.split("-")
         return parts[0] if parts else card_id
 
 
-def _int_or_none(val: Any) -> Optional[int]:
-    if val is None or val == "" or val == "null":
-        return None
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
+@functools.lru_cache(maxsize=8192)
+def _image_url_for_id(card_id: str) -> str:
+    """Default image URL for a card without an absolute one of its own."""
+    return f"{IMAGE_BASE}/{card_id}.jpg"
@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import sys
 from typing import Any, Dict, List, Optional
 
-import httpx
-
+from onepiece_scraper import _json
+from onepiece_scraper.adapters._fields import (
+    extract_fields,
+    int_or_none,
+    interned_lower,
+    interned_str,
+    split_slash,
+    split_traits,
+)
+from onepiece_scraper.http import RateLimiter, shared_client
 from onepiece_scraper.models import CardData, SetInfo
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://optcg-api.com"  # ryanmichaelhirst API
 
+# (attr, key, fallback_key, default, convert) — see adapters._fields
+_RYAN_FIELDS = (
+    ("id", "code", "id", "", interned_str),
+    ("name", "name", None, "", str),
+    ("card_type", "type", None, "", interned_lower),
+    ("cost", "cost", None, None, int_or_none),
+    ("power", "power", None, None, int_or_none),
+    ("counter", "counter", None, None, int_or_none),
+    ("colors", "color", None, "", split_slash),
+    ("rarity", "rarity", None, "", interned_str),
+    ("traits", "class", "traits", "", split_traits),
+    ("text", "effect", "text", "", str),
+    ("life", "life", None, None, int_or_none),
+    ("image_url", "image", None, "", str),
+)
+
 
 class RyanApiAdapter:
     """Secondary adapter using the ryanmichaelhirst OPTCG API.
@@ -25,32 +49,18 @@ class RyanApiAdapter:
     """
 
     def __init__(self, rate_limit_ms: int = 500) -> None:
-        self._rate_limit = rate_limit_ms / 1000.0
-        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter = RateLimiter(rate_limit_ms / 1000.0)
 
     @property
     def name(self) -> str:
         return "ryan-api"
 
-    def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=BASE_URL,
-                timeout=30.0,
-                headers={"User-Agent": "ManaMesh-OnePieceScraper/0.1"},
-            )
-        return self._client
-
-    async def _throttle(self) -> None:
-        if self._rate_limit > 0:
-            await asyncio.sleep(self._rate_limit)
-
     async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        client = self._get_client()
-        await self._throttle()
-        resp = await client.get(path, params=params)
+        client = shared_client()
+        async with self._limiter:
+            resp = await client.get(f"{BASE_URL}{path}", params=params)
         resp.raise_for_status()
-        return resp.json()
+        return await _json.loads_async(resp.content)
 
     # ------------------------------------------------------------------
     # Public interface
@@ -113,48 +123,15 @@ class RyanApiAdapter:
         return card.image_url
 
     async def close(self) -> None:
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        # The HTTP client is shared and left open: the scraper closes it at
+        # teardown, standalone callers with close_shared_client().
+        pass
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _parse_card(self, raw: Dict[str, Any], default_set_id: str) -> CardData:
-        card_id = str(raw.get("code", raw.get("id", "")))
-        color_raw = str(raw.get("color", ""))
-        colors = [c.strip() for c in color_raw.split("/") if c.strip()] if color_raw else []
-
-        traits_raw = raw.get("class", raw.get("traits", ""))
-        if isinstance(traits_raw, str):
-            traits = [t.strip() for t in traits_raw.split("/") if t.strip()]
-        elif isinstance(traits_raw, list):
-            traits = traits_raw
-        else:
-            traits = []
-
         return CardData(
-            id=card_id,
-            name=str(raw.get("name", "")),
-            card_type=str(raw.get("type", "")).lower(),
-            cost=_int_or_none(raw.get("cost")),
-            power=_int_or_none(raw.get("power")),
-            counter=_int_or_none(raw.get("counter")),
-            colors=colors,
-            rarity=str(raw.get("rarity", "")),
-            traits=traits,
-            text=str(raw.get("effect", raw.get("text", ""))),
-            life=_int_or_none(raw.get("life")),
-            image_url=str(raw.get("image", "")),
-            set_id=default_set_id,
-            source=self.name,
+            **extract_fields(raw, _RYAN_FIELDS), set_id=sys.intern(default_set_id), source=self.name,
         )
-
-
-def _int_or_none(val: Any) -> Optional[int]:
-    if val is None or val == "" or val == "null":
-        return None
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
@@ -2,15 +2,41 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from onepiece_scraper import _json
+from onepiece_scraper.adapters._fields import (
+    extract_chained,
+    int_or_none,
+    interned_lower,
+    interned_str,
+    split_slash,
+    split_traits,
+)
 from onepiece_scraper.models import CardData, SetInfo
 
 logger = logging.getLogger(__name__)
 
+# (attr, keys, default, convert) — vegapull dumps vary in key naming, so
+# each attribute lists every known spelling in priority order.
+_VEGAPULL_FIELDS = (
+    ("id", ("code", "id", "card_id"), "", interned_str),
+    ("name", ("name", "card_name"), "", str),
+    ("card_type", ("type", "card_type"), "", interned_lower),
+    ("cost", ("cost", "card_cost"), None, int_or_none),
+    ("power", ("power", "card_power"), None, int_or_none),
+    ("counter", ("counter", "counter_amount"), None, int_or_none),
+    ("colors", ("color", "card_color"), "", split_slash),
+    ("rarity", ("rarity",), "", interned_str),
+    ("traits", ("traits", "class", "sub_types"), "", split_traits),
+    ("text", ("text", "effect", "card_text"), "", str),
+    ("life", ("life",), None, int_or_none),
+    ("image_url", ("image", "image_url", "card_image"), "", str),
+)
+
 
 class VegapullRecordsAdapter:
     """Last-resort adapter that reads from locally-downloaded vegapull-records archives.
@@ -38,7 +64,7 @@ class VegapullRecordsAdapter:
 
         for json_file in sorted(self._local_path.rglob("*.json")):
             try:
-                data = json.loads(json_file.read_text(encoding="utf-8"))
+                data = _json.loads(json_file.read_bytes())
                 cards_list = data if isinstance(data, list) else data.get("cards", [data])
                 for card in cards_list:
                     set_id = self._extract_set_id(card)
@@ -51,7 +77,7 @@ class VegapullRecordsAdapter:
                                 category=self._guess_category(set_id),
                             )
                         )
-            except (json.JSONDecodeError, OSError):
+            except (ValueError, OSError):
                 logger.warning("Vegapull: failed to read %s", json_file)
 
         logger.info("Vegapull: found %d sets from local files", len(sets))
@@ -65,7 +91,7 @@ class VegapullRecordsAdapter:
         all_cards: List[CardData] = []
         for json_file in sorted(self._local_path.rglob("*.json")):
             try:
-                data = json.loads(json_file.read_text(encoding="utf-8"))
+                data = _json.loads(json_file.read_bytes())
                 cards_list = data if isinstance(data, list) else data.get("cards", [data])
                 for raw in cards_list:
                     if self._extract_set_id(raw) == set_id:
@@ -73,7 +99,7 @@ class VegapullRecordsAdapter:
                             all_cards.append(self._parse_card(raw, set_id))
                         except Exception:
                             pass
-            except (json.JSONDecodeError, OSError):
+            except (ValueError, OSError):
                 pass
 
         logger.info("Vegapull: set %s -> %d cards", set_id, len(all_cards))
@@ -110,32 +136,9 @@ class VegapullRecordsAdapter:
         return None
 
     def _parse_card(self, raw: Dict[str, Any], default_set_id: str) -> CardData:
-        card_id = str(raw.get("code", raw.get("id", raw.get("card_id", ""))))
-        color_raw = str(raw.get("color", raw.get("card_color", "")))
-        colors = [c.strip() for c in color_raw.split("/") if c.strip()] if color_raw else []
-
-        traits_raw = raw.get("traits", raw.get("class", raw.get("sub_types", "")))
-        if isinstance(traits_raw, str):
-            traits = [t.strip() for t in traits_raw.split("/") if t.strip()]
-        elif isinstance(traits_raw, list):
-            traits = traits_raw
-        else:
-            traits = []
-
         return CardData(
-            id=card_id,
-            name=str(raw.get("name", raw.get("card_name", ""))),
-            card_type=str(raw.get("type", raw.get("card_type", ""))).lower(),
-            cost=_int_or_none(raw.get("cost", raw.get("card_cost"))),
-            power=_int_or_none(raw.get("power", raw.get("card_power"))),
-            counter=_int_or_none(raw.get("counter", raw.get("counter_amount"))),
-            colors=colors,
-            rarity=str(raw.get("rarity", "")),
-            traits=traits,
-            text=str(raw.get("text", raw.get("effect", raw.get("card_text", "")))),
-            life=_int_or_none(raw.get("life")),
-            image_url=str(raw.get("image", raw.get("image_url", raw.get("card_image", "")))),
-            set_id=default_set_id,
+            **extract_chained(raw, _VEGAPULL_FIELDS),
+            set_id=sys.intern(default_set_id),
             source="vegapull-records",
         )
 
@@ -149,12 +152,3 @@ class VegapullRecordsAdapter:
         if "PROMO" in upper or upper.startswith("P-"):
             return "promo"
         return "extra"
-
-
-def _int_or_none(val: Any) -> Optional[int]:
-    if val is None or val == "" or val == "null":
-        return None
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
@@ -2,19 +2,35 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 import yaml
 
+from onepiece_scraper import _json
+from onepiece_scraper.adapters import available_sources
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_PATH = Path("config.yaml")
 
+KNOWN_SOURCES = available_sources()
+IMAGE_FORMATS = frozenset({"original", "tar"})
 
-@dataclass
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True, frozen=True)
 class SourceConfig:
     """Configuration for a single adapter source."""
 
@@ -25,16 +41,16 @@ class SourceConfig:
     local_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OutputConfig:
     """Output directory and format settings."""
 
     base_dir: str = "./output/onepiece/"
-    image_format: str = "original"
+    image_format: str = "original"  # "original" (one file per card) or "tar" (one archive per set)
     manifest_version: str = "1.0"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScrapeConfig:
     """What to scrape."""
 
@@ -43,7 +59,7 @@ class ScrapeConfig:
     include_promos: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StateConfig:
     """State persistence settings."""
 
@@ -52,7 +68,13 @@ class StateConfig:
 
 @dataclass
 class AppConfig:
-    """Top-level application configuration."""
+    """Top-level application configuration.
+
+    The section configs are frozen; this class stays mutable so
+    ``_parse_config`` can fill it in section by section.
+    ``enabled_sources`` and ``set_filter`` are computed once and cached;
+    reassigning ``sources`` or ``scrape`` drops the cached values.
+    """
 
     sources: List[SourceConfig] = field(default_factory=lambda: [
         SourceConfig(name="optcg-api", priority=1, rate_limit_ms=200),
@@ -63,7 +85,14 @@ class AppConfig:
     scrape: ScrapeConfig = field(default_factory=ScrapeConfig)
     state: StateConfig = field(default_factory=StateConfig)
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "sources":
+            self.__dict__.pop("enabled_sources", None)
+        elif name == "scrape":
+            self.__dict__.pop("set_filter", None)
+
+    @functools.cached_property
     def enabled_sources(self) -> List[SourceConfig]:
         """Return enabled sources sorted by priority."""
         return sorted(
@@ -71,7 +100,7 @@ class AppConfig:
             key=lambda s: s.priority,
         )
 
-    @property
+    @functools.cached_property
     def set_filter(self) -> Optional[List[str]]:
         """Return list of set IDs to scrape, or None for all."""
         if self.scrape.sets == "all":
@@ -80,15 +109,26 @@ class AppConfig:
 
 
 def load_config(path: Optional[Path] = None) -> AppConfig:
-    """Load configuration from a YAML file, falling back to defaults."""
+    """Load configuration from a YAML file, falling back to defaults.
+
+    The parsed YAML is cached in a ``.<name>.cache.json`` sidecar keyed on
+    the file's mtime and size, so repeat runs skip YAML parsing entirely.
+    """
     config_path = path or DEFAULT_CONFIG_PATH
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         logger.info("No config file at %s, using defaults", config_path)
         return AppConfig()
 
     logger.info("Loading config from %s", config_path)
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    cache_path = config_path.with_name(f".{config_path.stem}.cache.json")
+    raw = _read_cached_raw(cache_path, st)
+    if raw is None:
+        with open(config_path, "r", encoding="utf-8") as f:
+            raw = yaml.load(f, Loader=_YamlLoader)
+        if raw:
+            _write_cached_raw(cache_path, st, raw)
 
     if not raw:
         return AppConfig()
@@ -96,53 +136,86 @@ def load_config(path: Optional[Path] = None) -> AppConfig:
     return _parse_config(raw)
 
 
+def _read_cached_raw(cache_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached raw config dict if it matches the YAML file's stat."""
+    try:
+        cached = _json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("mtime_ns") != st.st_mtime_ns
+        or cached.get("size") != st.st_size
+    ):
+        return None
+    return cached.get("raw")
+
+
+def _write_cached_raw(cache_path: Path, st: os.stat_result, raw: Dict[str, Any]) -> None:
+    """Best-effort write of the config cache sidecar.
+
+    The config is only cached if it decodes back to exactly ``raw``:
+    JSON would turn YAML dates and non-string keys into strings, and a
+    cache hit must return the same dict as a fresh parse.
+    """
+    payload = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "raw": raw}
+    try:
+        encoded = _json.dumps_pretty(payload)
+    except TypeError as exc:
+        logger.debug("Not caching config %s: %s", cache_path, exc)
+        return
+    if _json.loads(encoded)["raw"] != raw:
+        logger.debug("Not caching config %s: it does not round-trip through JSON", cache_path)
+        return
+    try:
+        cache_path.write_bytes(encoded)
+    except OSError as exc:
+        logger.debug("Not caching config %s: %s", cache_path, exc)
+
+
 def _parse_config(raw: Dict[str, Any]) -> AppConfig:
     """Parse raw YAML dict into AppConfig."""
     config = AppConfig()
 
-    # Sources
     if "sources" in raw:
-        config.sources = []
+        sources = []
         for src in raw["sources"]:
-            config.sources.append(
-                SourceConfig(
-                    name=src["name"],
-                    enabled=src.get("enabled", True),
-                    priority=src.get("priority", 99),
-                    rate_limit_ms=src.get("rate_limit_ms", 200),
-                    local_path=src.get("local_path"),
-                )
-            )
+            if "name" not in src:
+                raise ValueError("Config error: every source needs a 'name'")
+            # Sources listed without a priority go after the built-in ones
+            sources.append(_from_dict(SourceConfig, src, priority=99))
+        config.sources = sources
 
-    # Output
     if "output" in raw:
-        out = raw["output"]
-        config.output = OutputConfig(
-            base_dir=out.get("base_dir", config.output.base_dir),
-            image_format=out.get("image_format", config.output.image_format),
-            manifest_version=out.get("manifest_version", config.output.manifest_version),
-        )
+        config.output = _from_dict(OutputConfig, raw["output"])
 
-    # Scrape
     if "scrape" in raw:
         scr = raw["scrape"]
-        config.scrape = ScrapeConfig(
-            sets=str(scr.get("sets", "all")),
-            include_starters=scr.get("include_starters", True),
-            include_promos=scr.get("include_promos", True),
-        )
+        config.scrape = _from_dict(ScrapeConfig, {**scr, "sets": str(scr.get("sets", "all"))})
 
-    # State
     if "state" in raw:
-        st = raw["state"]
-        config.state = StateConfig(
-            state_file=st.get("state_file", config.state.state_file),
-        )
+        config.state = _from_dict(StateConfig, raw["state"])
 
     _validate_config(config)
     return config
 
 
+def _from_dict(cls: Type[_T], raw: Dict[str, Any], **defaults: Any) -> _T:
+    """Build a config section from the keys of ``raw`` that name its fields.
+
+    Unknown keys are ignored.  ``defaults`` stand in for keys missing from
+    ``raw`` where the YAML default differs from the dataclass default.
+    """
+    values = {name: raw[name] for name in _field_names(cls) if name in raw}
+    return cls(**{**defaults, **values})
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of a config dataclass, introspected once per class."""
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
 def _validate_config(config: AppConfig) -> None:
     """Validate config and raise on errors."""
     if not config.sources:
@@ -152,10 +225,17 @@ def _validate_config(config: AppConfig) -> None:
     if len(names) != len(set(names)):
         raise ValueError("Config error: duplicate source names found")
 
-    known = {"optcg-api", "ryan-api", "vegapull-records"}
     for src in config.sources:
-        if src.name not in known:
-            raise ValueError(f"Config error: unknown source '{src.name}'. Known: {known}")
+        if src.name not in KNOWN_SOURCES:
+            raise ValueError(
+                f"Config error: unknown source '{src.name}'. Known: {set(KNOWN_SOURCES)}"
+            )
+
+    if config.output.image_format not in IMAGE_FORMATS:
+        raise ValueError(
+            f"Config error: unknown image_format '{config.output.image_format}'. "
+            f"Known: {set(IMAGE_FORMATS)}"
+        )
 
     enabled = config.enabled_sources
     if not enabled:
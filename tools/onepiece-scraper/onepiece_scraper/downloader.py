@@ -3,75 +3,125 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
+import os
+import tarfile
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-import httpx
-
-from onepiece_scraper.models import CardData
+from onepiece_scraper._urls import url_extension
+from onepiece_scraper.http import shared_client
+from onepiece_scraper.models import TAR_NAME, CardData
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 BACKOFF_BASE = 1.0  # seconds — exponential backoff: 1, 2, 4
+CHUNK_SIZE = 65536  # bytes per streamed read
+DOWNLOAD_TIMEOUT = 60.0  # seconds, per image request
+_EOF_MARKER_SIZE = 2 * tarfile.BLOCKSIZE  # two NUL blocks end a tar archive
 
 
 class ImageDownloader:
-    """Downloads card images concurrently with retry logic."""
+    """Downloads card images concurrently with retry logic.
+
+    With ``image_format="tar"`` images are appended to one
+    ``<set>/cards.tar`` per set instead of written as individual files
+    under ``<set>/cards/``.  Each member is flushed to the file as soon as
+    it is added; call ``finish_set()`` once a set is done to close its
+    archive, and ``close()`` at shutdown for any still open.
+    """
 
     def __init__(
         self,
         output_dir: str,
         concurrency: int = 5,
         max_retries: int = MAX_RETRIES,
+        image_format: str = "original",
     ) -> None:
         self._output_dir = Path(output_dir)
+        self._concurrency = concurrency
         self._semaphore = asyncio.Semaphore(concurrency)
         self._max_retries = max_retries
-        self._client: Optional[httpx.AsyncClient] = None
+        self._use_tar = image_format == "tar"
+        self._tars: Dict[str, tarfile.TarFile] = {}
+        self._tar_members: Dict[str, Set[str]] = {}
+        self._made_dirs: Set[Path] = set()
 
-    def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=60.0,
-                follow_redirects=True,
-                headers={"User-Agent": "ManaMesh-OnePieceScraper/0.1"},
-            )
-        return self._client
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
 
     def image_path(self, set_id: str, card_id: str, ext: str = "jpg") -> Path:
         """Return the local file path for a card image."""
         return self._output_dir / set_id / "cards" / f"{card_id}.{ext}"
 
+    def image_location(self, set_id: str, card_id: str, ext: str = "jpg") -> str:
+        """Return where a card image is stored, as recorded in scrape state.
+
+        In tar mode this is ``<set>/cards.tar#<card_id>.<ext>``.
+        """
+        if self._use_tar:
+            return f"{self._output_dir / set_id / TAR_NAME}#{card_id}.{ext}"
+        return str(self.image_path(set_id, card_id, ext))
+
     def image_exists(self, set_id: str, card_id: str, ext: str = "jpg") -> bool:
+        if self._use_tar:
+            return f"{card_id}.{ext}" in self._tar_index(set_id)
         return self.image_path(set_id, card_id, ext).exists()
 
+    def prefetch_existing(self, set_id: str) -> Set[str]:
+        """Return the file names already present in a set's image directory.
+
+        One directory scan replaces a ``stat`` per card when skipping
+        images that were downloaded by an earlier run.  In tar mode the
+        archive's member names are returned instead.
+        """
+        if self._use_tar:
+            return set(self._tar_index(set_id))
+        try:
+            with os.scandir(self._output_dir / set_id / "cards") as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
     async def download_card_image(
-        self, card: CardData, image_url: str
+        self,
+        card: CardData,
+        image_url: str,
+        existing: Optional[Set[str]] = None,
     ) -> Tuple[bool, Optional[str]]:
         """Download a single card image with retry.
 
+        ``existing`` is an optional result of ``prefetch_existing`` for the
+        card's set; when given it is consulted instead of the filesystem.
+
         Returns (success, error_message).
         """
         if not image_url:
             return False, "No image URL"
 
-        ext = _url_extension(image_url)
+        ext = url_extension(image_url)
         dest = self.image_path(card.set_id, card.id, ext)
 
-        if dest.exists():
+        if existing is not None:
+            already_downloaded = dest.name in existing
+        elif self._use_tar:
+            already_downloaded = dest.name in self._tar_index(card.set_id)
+        else:
+            already_downloaded = dest.exists()
+        if already_downloaded:
             return True, None
 
-        dest.parent.mkdir(parents=True, exist_ok=True)
-
         async with self._semaphore:
             for attempt in range(1, self._max_retries + 1):
                 try:
-                    client = self._get_client()
-                    resp = await client.get(image_url)
-                    resp.raise_for_status()
-                    dest.write_bytes(resp.content)
+                    if self._use_tar:
+                        await self._fetch_into_tar(card.set_id, dest.name, image_url)
+                    else:
+                        await self._fetch_to_file(dest, image_url)
                     return True, None
                 except Exception as exc:
                     if attempt < self._max_retries:
@@ -86,12 +136,96 @@ class ImageDownloader:
                         )
                         await asyncio.sleep(delay)
                     else:
-                        error = f"Failed after {self._max_retries} attempts: {exc}"
-                        logger.warning("Download failed for %s: %s", card.id, error)
-                        return False, error
+                        logger.warning(
+                            "Download failed for %s after %d attempts: %s",
+                            card.id,
+                            self._max_retries,
+                            exc,
+                        )
+                        return False, "Failed after %d attempts: %s" % (self._max_retries, exc)
 
         return False, "Unknown error"
 
+    async def _fetch_to_file(self, dest: Path, image_url: str) -> None:
+        # Stream into a sibling .part file and rename on success so an
+        # interrupted download never leaves a truncated image at dest.
+        # File calls run in worker threads so a slow disk doesn't stall
+        # the other downloads sharing the event loop.
+        await self._ensure_dir(dest.parent)
+        part = dest.with_name(dest.name + ".part")
+        try:
+            async with shared_client().stream(
+                "GET", image_url, timeout=DOWNLOAD_TIMEOUT, follow_redirects=True,
+            ) as resp:
+                resp.raise_for_status()
+                f = await asyncio.to_thread(part.open, "wb")
+                try:
+                    async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+            await asyncio.to_thread(os.replace, part, dest)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+
+    async def _ensure_dir(self, path: Path) -> None:
+        """Create ``path`` once per run, off the event loop thread."""
+        if path not in self._made_dirs:
+            await asyncio.to_thread(path.mkdir, parents=True, exist_ok=True)
+            self._made_dirs.add(path)
+
+    async def _fetch_into_tar(self, set_id: str, name: str, image_url: str) -> None:
+        # Buffer the whole image first: a tar member's size goes in its
+        # header, and a failed download must not leave a partial member.
+        buf = io.BytesIO()
+        async with shared_client().stream(
+            "GET", image_url, timeout=DOWNLOAD_TIMEOUT, follow_redirects=True,
+        ) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                buf.write(chunk)
+
+        info = tarfile.TarInfo(name)
+        info.size = buf.tell()
+        info.mtime = int(time.time())
+        buf.seek(0)
+        # addfile is synchronous, so concurrent downloads on this event
+        # loop append whole members one at a time.  Flushing before the
+        # member is reported means any image recorded as downloaded is
+        # already in the file, even if the run is killed later.
+        tar = self._open_tar(set_id)
+        tar.addfile(info, buf)
+        tar.fileobj.flush()
+        self._tar_members[set_id].add(name)
+
+    def finish_set(self, set_id: str) -> None:
+        """Close a set's archive, writing its end-of-archive marker.
+
+        A no-op outside tar mode or when the set's archive isn't open.
+        """
+        tar = self._tars.pop(set_id, None)
+        if tar is not None:
+            tar.close()
+
+    def _tar_index(self, set_id: str) -> Set[str]:
+        """Member names of a set's archive, read once per run."""
+        members = self._tar_members.get(set_id)
+        if members is None:
+            path = self._output_dir / set_id / TAR_NAME
+            members = _read_tar_names(path) if path.exists() else set()
+            self._tar_members[set_id] = members
+        return members
+
+    def _open_tar(self, set_id: str) -> tarfile.TarFile:
+        tar = self._tars.get(set_id)
+        if tar is None:
+            self._tar_index(set_id)
+            path = self._output_dir / set_id / TAR_NAME
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tar = self._tars[set_id] = tarfile.open(path, "a")
+        return tar
+
     async def download_batch(
         self,
         cards: List[CardData],
@@ -100,39 +234,73 @@ class ImageDownloader:
     ) -> Tuple[int, int]:
         """Download images for a batch of cards concurrently.
 
+        Results are consumed as each download finishes, so progress
+        updates in real time rather than when the whole batch is done.
+
         Returns (success_count, failure_count).
         """
-        tasks = []
-        for card in cards:
-            url = get_url(card)
-            tasks.append(self._download_with_progress(card, url, progress_callback))
-
-        results = await asyncio.gather(*tasks)
-        successes = sum(1 for ok, _ in results if ok)
-        failures = len(results) - successes
-        return successes, failures
+        tasks = [self.download_card_image(card, get_url(card)) for card in cards]
 
-    async def _download_with_progress(
-        self,
-        card: CardData,
-        image_url: str,
-        progress_callback: Optional[callable],
-    ) -> Tuple[bool, Optional[str]]:
-        result = await self.download_card_image(card, image_url)
-        if progress_callback:
-            progress_callback()
-        return result
+        successes = failures = 0
+        for next_done in asyncio.as_completed(tasks):
+            ok, _ = await next_done
+            if ok:
+                successes += 1
+            else:
+                failures += 1
+            if progress_callback:
+                progress_callback()
+        return successes, failures
 
     async def close(self) -> None:
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-
-
-def _url_extension(url: str) -> str:
-    """Extract file extension from a URL, defaulting to jpg."""
-    path = url.split("?")[0].split("#")[0]
-    if "." in path.split("/")[-1]:
-        ext = path.rsplit(".", 1)[-1].lower()
-        if ext in ("jpg", "jpeg", "png", "webp", "gif"):
-            return ext
-    return "jpg"
+        for tar in self._tars.values():
+            tar.close()
+        self._tars.clear()
+        self._tar_members.clear()
+
+
+def _read_tar_names(path: Path) -> Set[str]:
+    """Return the member names of an archive, repairing it if damaged.
+
+    An archive cut short (e.g. by a run killed mid-append, inside a
+    member's data or its header) is truncated after its last intact
+    member, so later appends produce a valid file and the lost images
+    are downloaded again.  A missing end-of-archive marker is restored
+    too, since append mode refuses archives without one.
+    """
+    names: Set[str] = set()
+    good_end = 0
+    damaged = False
+    size = path.stat().st_size
+    try:
+        with tarfile.open(path, "r") as tar:
+            for info in tar:
+                end = info.offset_data + -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                if end > size:
+                    damaged = True
+                    break
+                names.add(info.name)
+                good_end = end
+    except tarfile.ReadError:
+        damaged = True
+
+    # Past the last member there should only be NUL end-of-archive
+    # blocks; anything else is a partial header that reading skips but
+    # append mode rejects.
+    with path.open("rb") as f:
+        f.seek(good_end)
+        tail = f.read()
+    damaged = damaged or bool(tail.strip(b"\0"))
+    if damaged:
+        logger.warning(
+            "Damaged archive %s: keeping %d intact members", path, len(names),
+        )
+    if not good_end:
+        if damaged:
+            path.unlink()
+    elif damaged or len(tail) < _EOF_MARKER_SIZE:
+        with path.open("r+b") as f:
+            f.truncate(good_end)
+            f.seek(good_end)
+            f.write(b"\0" * _EOF_MARKER_SIZE)
+    return names
@@ -0,0 +1,109 @@
+"""Shared httpx client for the adapters and the image downloader."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import time
+import weakref
+from typing import Optional
+
+import httpx
+
+# httpx only negotiates HTTP/2 when the optional h2 package is installed
+# (the ``http2`` extra); without it clients stay on HTTP/1.1 keep-alive.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+KEEPALIVE_EXPIRY = 30.0  # seconds an idle pooled connection stays open
+TIMEOUT = 30.0  # default per-request timeout; image downloads pass their own
+USER_AGENT = "ManaMesh-OnePieceScraper/0.1"
+
+# Pool limits for a client created without a download concurrency, e.g.
+# when an adapter is used on its own.
+CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=KEEPALIVE_EXPIRY,
+)
+
+
+def pool_limits(concurrency: int) -> httpx.Limits:
+    """Connection pool limits sized so concurrent requests reuse sockets."""
+    return httpx.Limits(
+        max_keepalive_connections=concurrency,
+        max_connections=concurrency * 2,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+# One client per event loop: httpx pools are bound to the loop they were
+# first used on, and entries disappear along with their loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_client(concurrency: Optional[int] = None) -> httpx.AsyncClient:
+    """Return the running event loop's shared client, creating it on first use.
+
+    Adapters and the downloader all send absolute URLs through this one
+    client so they share a connection pool, DNS lookups and TLS sessions.
+    ``concurrency`` sizes the pool (see ``pool_limits``) when this call
+    creates the client; later calls reuse whatever pool exists, so the
+    scraper creates it up front from the download concurrency.
+
+    Nothing else closes the client: the scraper does so at teardown, and
+    code using adapters on their own must call ``close_shared_client()``.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        limits = CLIENT_LIMITS if concurrency is None else pool_limits(concurrency)
+        client = _clients[loop] = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE, limits=limits, retries=2,
+            ),
+            timeout=TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+        )
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client for the running event loop, if one is open."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+class RateLimiter:
+    """Async rate gate allowing at most one request per ``interval`` seconds.
+
+    Each caller reserves the next free time slot and sleeps only until
+    that slot, so a request arriving after an idle period goes out
+    immediately and concurrent callers are spaced evenly instead of each
+    paying a full sleep.  Share one instance across all tasks that hit
+    the same API.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        if self._interval <= 0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        # No await between reading and updating the slot, so concurrent
+        # tasks on the same event loop can't claim the same one.
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
@@ -7,16 +7,24 @@ from packages/frontend/src/assets/manifest/types.ts.
 
 from __future__ import annotations
 
-import json
+import dataclasses
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from onepiece_scraper.models import CardData, SetInfo
+from onepiece_scraper import _json
+from onepiece_scraper._urls import url_extension
+from onepiece_scraper.models import TAR_NAME, CardData, SetInfo
 
 logger = logging.getLogger(__name__)
 
 
+def _write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    """Write a manifest dict as JSON, atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _json.dump_file(path, manifest)
+
+
 def generate_root_manifest(
     output_dir: str,
     sets: List[SetInfo],
@@ -34,11 +42,7 @@ def generate_root_manifest(
     }
 
     out_path = Path(output_dir) / "manifest.json"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _write_manifest(out_path, manifest)
     logger.info("Wrote root manifest: %s (%d sets)", out_path, len(sets))
     return manifest
 
@@ -48,15 +52,21 @@ def generate_set_manifest(
     set_info: SetInfo,
     cards: List[CardData],
     version: str = "1.0.0",
+    image_format: str = "original",
 ) -> Dict[str, Any]:
-    """Generate a per-set manifest.json with CardManifestEntry items."""
+    """Generate a per-set manifest.json with CardManifestEntry items.
+
+    With ``image_format="tar"`` each ``front`` points into the set's
+    archive as ``cards.tar#<card_id>.<ext>``.
+    """
+    front_prefix = f"{TAR_NAME}#" if image_format == "tar" else "cards/"
     card_entries = []
     for card in cards:
         entry: Dict[str, Any] = {
             "id": card.id,
             "name": card.name,
-            "front": f"cards/{card.id}.{_guess_ext(card.image_url)}",
-            "metadata": _build_metadata(card),
+            "front": f"{front_prefix}{card.id}.{url_extension(card.image_url)}",
+            "metadata": _metadata_builder(card),
         }
         card_entries.append(entry)
 
@@ -68,11 +78,7 @@ def generate_set_manifest(
     }
 
     out_path = Path(output_dir) / set_info.id / "manifest.json"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _write_manifest(out_path, manifest)
     logger.info("Wrote set manifest: %s (%d cards)", out_path, len(cards))
     return manifest
 
@@ -83,36 +89,44 @@ def validate_manifest(manifest: Dict[str, Any]) -> List[str]:
     Returns a list of error strings (empty = valid).
     """
     errors: List[str] = []
+    append = errors.append
 
     for required in ("name", "version", "game"):
         if required not in manifest:
-            errors.append(f"Missing required field: {required}")
+            append(f"Missing required field: {required}")
 
     if manifest.get("game") != "onepiece":
-        errors.append(f"Expected game='onepiece', got '{manifest.get('game')}'")
+        append(f"Expected game='onepiece', got '{manifest.get('game')}'")
 
     if "cards" in manifest:
-        seen_ids: set = set()
+        # One pass checks fields and counts ids, remembering where each
+        # id first repeats; duplicates are reported with their totals.
+        id_counts: Dict[str, int] = {}
+        first_repeat: Dict[str, int] = {}
+        get_count = id_counts.get
         for i, card in enumerate(manifest["cards"]):
-            prefix = f"cards[{i}]"
-            if "id" not in card:
-                errors.append(f"{prefix}: missing 'id'")
-            elif card["id"] in seen_ids:
-                errors.append(f"{prefix}: duplicate id '{card['id']}'")
+            if "id" in card:
+                card_id = card["id"]
+                count = id_counts[card_id] = get_count(card_id, 0) + 1
+                if count == 2:
+                    first_repeat[card_id] = i
             else:
-                seen_ids.add(card["id"])
+                append(f"cards[{i}]: missing 'id'")
             if "name" not in card:
-                errors.append(f"{prefix}: missing 'name'")
+                append(f"cards[{i}]: missing 'name'")
             if "front" not in card:
-                errors.append(f"{prefix}: missing 'front'")
+                append(f"cards[{i}]: missing 'front'")
+        errors.extend(
+            f"cards[{i}]: duplicate id '{card_id}' ({id_counts[card_id]} entries)"
+            for card_id, i in first_repeat.items()
+        )
 
     if "sets" in manifest:
         for i, s in enumerate(manifest["sets"]):
-            prefix = f"sets[{i}]"
             if "name" not in s:
-                errors.append(f"{prefix}: missing 'name'")
+                append(f"sets[{i}]: missing 'name'")
             if "path" not in s:
-                errors.append(f"{prefix}: missing 'path'")
+                append(f"sets[{i}]: missing 'path'")
 
     return errors
 
@@ -141,13 +155,44 @@ def _build_metadata(card: CardData) -> Dict[str, Any]:
     return meta
 
 
-def _guess_ext(image_url: str) -> str:
-    """Guess the file extension from an image URL."""
-    if not image_url:
-        return "jpg"
-    path = image_url.split("?")[0].split("#")[0]
-    if "." in path.split("/")[-1]:
-        ext = path.rsplit(".", 1)[-1].lower()
-        if ext in ("jpg", "jpeg", "png", "webp", "gif"):
-            return ext
-    return "jpg"
+# Optional metadata fields in output order: (manifest key, CardData
+# attribute, keep_falsy).  keep_falsy fields are emitted whenever they
+# are not None (cost 0 is meaningful); the rest only when truthy.
+_METADATA_FIELDS = (
+    ("cost", "cost", True),
+    ("power", "power", True),
+    ("colors", "colors", False),
+    ("rarity", "rarity", False),
+    ("traits", "traits", False),
+    ("text", "text", False),
+    ("counter", "counter", True),
+    ("life", "life", True),
+)
+
+
+def _compile_metadata_builder() -> Callable[[CardData], Dict[str, Any]]:
+    """Generate a straight-line equivalent of ``_build_metadata``.
+
+    The source is emitted once at import from ``_METADATA_FIELDS`` so the
+    per-card call runs flat bytecode with each attribute read into a local,
+    instead of re-evaluating ``card.attr`` in both the test and the store.
+    """
+    attrs = {f.name for f in dataclasses.fields(CardData)}
+    lines = [
+        "def build_metadata(card):",
+        "    meta = {'cardType': card.card_type}",
+    ]
+    for key, attr, keep_falsy in _METADATA_FIELDS:
+        if attr not in attrs:
+            raise AttributeError(f"CardData has no field {attr!r}")
+        lines.append(f"    value = card.{attr}")
+        lines.append("    if value is not None:" if keep_falsy else "    if value:")
+        lines.append(f"        meta[{key!r}] = value")
+    lines.append("    return meta")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<manifest metadata builder>", "exec"), namespace)
+    return namespace["build_metadata"]
+
+
+_metadata_builder = _compile_metadata_builder()
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
+TAR_NAME = "cards.tar"  # per-set image archive used when image_format == "tar"
 
-@dataclass
+# Canonical status strings, so statuses loaded from the state file share
+# one object per value with the ones set during a run.
+_STATUS = {s: sys.intern(s) for s in ("success", "failed", "pending")}
+
+
+@dataclass(slots=True, frozen=True)
 class SetInfo:
-    """Metadata about a card set / expansion."""
+    """Metadata about a card set / expansion.  Immutable and hashable."""
 
     id: str  # e.g. "OP-01"
     name: str  # e.g. "Romance Dawn"
     category: str  # "booster", "starter", "promo", "extra"
 
 
-@dataclass
+@dataclass(slots=True)
 class CardData:
     """Normalized card data produced by any adapter."""
 
@@ -25,9 +32,9 @@ class CardData:
     cost: Optional[int]
     power: Optional[int]
     counter: Optional[int]
-    colors: list[str]
+    colors: tuple[str, ...]  # shared across cards; see adapters._fields
     rarity: str
-    traits: list[str]
+    traits: tuple[str, ...]
     text: str
     life: Optional[int]  # leaders only
     image_url: str
@@ -35,9 +42,12 @@ class CardData:
     source: str  # which adapter provided this data
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CardImageStatus:
-    """Download status for a single card image."""
+    """Download status for a single card image.
+
+    A read-only view assembled on demand by ``SetScrapeState.image()``.
+    """
 
     card_id: str
     status: str  # "success", "failed", "pending"
@@ -45,17 +55,55 @@ class CardImageStatus:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SetScrapeState:
-    """Scrape state for a single set."""
+    """Scrape state for a single set.
+
+    Image status is kept column-wise, keyed by card ID: every marked image
+    has an ``image_status`` entry, while ``image_path`` and ``image_error``
+    only hold the cards that actually have one.  ``images_ok`` and
+    ``images_failed`` count statuses: they are computed at construction
+    and kept current by ``ScrapeState.mark_image``; call
+    ``recount_images()`` after editing ``image_status`` directly.
+    """
 
     set_id: str
     last_scraped: Optional[str] = None  # ISO timestamp
-    card_ids: list[str] = field(default_factory=list)
-    images: dict[str, CardImageStatus] = field(default_factory=dict)
+    card_ids: set[str] = field(default_factory=set)  # stored sorted in the state file
+    image_status: dict[str, str] = field(default_factory=dict)
+    image_path: dict[str, str] = field(default_factory=dict)
+    image_error: dict[str, str] = field(default_factory=dict)
+    images_ok: int = field(default=0, init=False, compare=False, repr=False)
+    images_failed: int = field(default=0, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.recount_images()
+
+    def recount_images(self) -> None:
+        statuses = list(self.image_status.values())
+        self.images_ok = statuses.count("success")
+        self.images_failed = statuses.count("failed")
+
+    def _count_status(self, status: Optional[str], delta: int) -> None:
+        if status == "success":
+            self.images_ok += delta
+        elif status == "failed":
+            self.images_failed += delta
+
+    def image(self, card_id: str) -> Optional[CardImageStatus]:
+        """Return the image status for a card, or None if never marked."""
+        status = self.image_status.get(card_id)
+        if status is None:
+            return None
+        return CardImageStatus(
+            card_id=card_id,
+            status=status,
+            path=self.image_path.get(card_id),
+            error=self.image_error.get(card_id),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeState:
     """Top-level scrape state tracking across all sets."""
 
@@ -66,16 +114,24 @@ class ScrapeState:
         return ss is not None and card_id in ss.card_ids
 
     def is_image_downloaded(self, set_id: str, card_id: str) -> bool:
+        ss = self.sets.get(set_id)
+        return ss is not None and ss.image_status.get(card_id) == "success"
+
+    def _set_state(self, set_id: str) -> SetScrapeState:
+        # get-then-insert rather than setdefault, which would build (and
+        # throw away) a SetScrapeState with its four containers per call.
         ss = self.sets.get(set_id)
         if ss is None:
-            return False
-        img = ss.images.get(card_id)
-        return img is not None and img.status == "success"
+            set_id = sys.intern(set_id)
+            ss = self.sets[set_id] = SetScrapeState(set_id=set_id)
+        return ss
 
     def mark_card_scraped(self, set_id: str, card_id: str) -> None:
-        ss = self.sets.setdefault(set_id, SetScrapeState(set_id=set_id))
-        if card_id not in ss.card_ids:
-            ss.card_ids.append(card_id)
+        self._set_state(set_id).card_ids.add(sys.intern(card_id))
+
+    def mark_cards_scraped(self, set_id: str, card_ids: Iterable[str]) -> None:
+        """Record a whole page or set of scraped cards with one set lookup."""
+        self._set_state(set_id).card_ids.update(map(sys.intern, card_ids))
 
     def mark_image(
         self,
@@ -85,7 +141,18 @@ class ScrapeState:
         path: Optional[str] = None,
         error: Optional[str] = None,
     ) -> None:
-        ss = self.sets.setdefault(set_id, SetScrapeState(set_id=set_id))
-        ss.images[card_id] = CardImageStatus(
-            card_id=card_id, status=status, path=path, error=error
-        )
+        card_id = sys.intern(card_id)
+        status = _STATUS.get(status) or sys.intern(status)
+        ss = self._set_state(set_id)
+        statuses = ss.image_status
+        ss._count_status(statuses.get(card_id), -1)
+        ss._count_status(status, 1)
+        statuses[card_id] = status
+        if path is None:
+            ss.image_path.pop(card_id, None)
+        else:
+            ss.image_path[card_id] = path
+        if error is None:
+            ss.image_error.pop(card_id, None)
+        else:
+            ss.image_error[card_id] = error
@@ -5,15 +5,17 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+from rich.progress import Progress, SpinnerColumn, BarColumn, TaskID, TextColumn, TimeElapsedColumn
 
+from onepiece_scraper._urls import url_extension
 from onepiece_scraper.adapters import get_adapter_class
 from onepiece_scraper.adapters.base import CardSourceAdapter
 from onepiece_scraper.config import AppConfig, SourceConfig
 from onepiece_scraper.downloader import ImageDownloader
+from onepiece_scraper.http import close_shared_client, shared_client
 from onepiece_scraper.manifest import generate_root_manifest, generate_set_manifest
 from onepiece_scraper.models import CardData, SetInfo
 from onepiece_scraper.state import StateTracker
@@ -26,8 +28,8 @@ class Scraper:
     """Orchestrates the full scrape pipeline:
     1. List sets from adapters (with fallback)
     2. Fetch card data per set (with fallback)
-    3. Download images
-    4. Generate manifests
+    3. Download images (overlapping with 2 via a bounded queue)
+    4. Generate manifests (per set as its images finish, then the root)
     5. Update state
     """
 
@@ -35,10 +37,15 @@ class Scraper:
         self._config = config
         self._adapters: List[CardSourceAdapter] = []
         self._state = StateTracker(config.state.state_file)
-        self._downloader = ImageDownloader(config.output.base_dir)
+        self._downloader = ImageDownloader(
+            config.output.base_dir, image_format=config.output.image_format,
+        )
 
     async def setup(self) -> None:
         """Initialize adapters from config."""
+        # Create the shared HTTP client now so its pool is sized for the
+        # image downloads rather than whichever adapter call comes first.
+        shared_client(self._downloader.concurrency)
         for src_cfg in self._config.enabled_sources:
             try:
                 cls = get_adapter_class(src_cfg.name)
@@ -59,6 +66,7 @@ class Scraper:
             except Exception:
                 pass
         await self._downloader.close()
+        await close_shared_client()
 
     async def run(self, force: bool = False, set_filter: Optional[List[str]] = None) -> None:
         """Execute the full scrape pipeline."""
@@ -82,10 +90,8 @@ class Scraper:
         else:
             console.print(f"Found {len(all_sets)} sets")
 
-        # 2. Fetch cards per set
-        console.print("\n[bold]Fetching card data...[/bold]")
-        all_cards: Dict[str, List[CardData]] = {}
-
+        # 2-4. Fetch cards, download images and write set manifests
+        console.print("\n[bold]Fetching cards and downloading images...[/bold]")
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -94,94 +100,24 @@ class Scraper:
             TimeElapsedColumn(),
             console=console,
         ) as progress:
-            task = progress.add_task("Sets", total=len(all_sets))
-            for set_info in all_sets:
-                cards = await self._fetch_cards(set_info.id, force)
-                if cards:
-                    all_cards[set_info.id] = cards
-                    # Mark cards in state
-                    for card in cards:
-                        self._state.state.mark_card_scraped(set_info.id, card.id)
-                    self._state.state.sets[set_info.id].last_scraped = (
-                        datetime.now(timezone.utc).isoformat()
-                    )
-                progress.advance(task)
+            all_cards, total_ok, total_fail = await self._run_pipeline(all_sets, force, progress)
 
         total_cards = sum(len(c) for c in all_cards.values())
         console.print(f"Fetched {total_cards} cards across {len(all_cards)} sets")
-
-        # 3. Download images
-        console.print("\n[bold]Downloading images...[/bold]")
-        total_ok = 0
-        total_fail = 0
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeElapsedColumn(),
-            console=console,
-        ) as progress:
-            for set_id, cards in all_cards.items():
-                # Filter out already-downloaded cards (unless force)
-                to_download = cards
-                if not force:
-                    to_download = [
-                        c for c in cards
-                        if not self._state.state.is_image_downloaded(set_id, c.id)
-                    ]
-
-                if not to_download:
-                    continue
-
-                task = progress.add_task(f"[cyan]{set_id}", total=len(to_download))
-
-                def advance_cb(t=task):
-                    progress.advance(t)
-
-                ok, fail = await self._downloader.download_batch(
-                    to_download,
-                    get_url=self._get_best_image_url,
-                    progress_callback=advance_cb,
-                )
-
-                # Update state
-                for card in to_download:
-                    if self._downloader.image_exists(set_id, card.id):
-                        self._state.state.mark_image(
-                            set_id, card.id, "success",
-                            path=str(self._downloader.image_path(set_id, card.id)),
-                        )
-                    else:
-                        self._state.state.mark_image(set_id, card.id, "failed")
-
-                total_ok += ok
-                total_fail += fail
-
         console.print(
             f"Images: [green]{total_ok} downloaded[/green], "
             f"[red]{total_fail} failed[/red]"
         )
 
-        # 4. Generate manifests
-        console.print("\n[bold]Generating manifests...[/bold]")
-        sets_with_cards = [s for s in all_sets if s.id in all_cards]
+        console.print("\n[bold]Generating root manifest...[/bold]")
         generate_root_manifest(
             self._config.output.base_dir,
-            sets_with_cards,
+            [s for s in all_sets if s.id in all_cards],
             version=self._config.output.manifest_version,
         )
-        for set_info in sets_with_cards:
-            generate_set_manifest(
-                self._config.output.base_dir,
-                set_info,
-                all_cards[set_info.id],
-                version=self._config.output.manifest_version,
-            )
 
         # 5. Save state
-        self._state.save()
+        self._state.flush()
         console.print("\n[bold green]Scrape complete![/bold green]")
 
     def get_status(self) -> Dict:
@@ -192,6 +128,95 @@ class Scraper:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _run_pipeline(
+        self, all_sets: List[SetInfo], force: bool, progress: Progress
+    ) -> Tuple[Dict[str, List[CardData]], int, int]:
+        """Fetch cards, download images and write set manifests concurrently.
+
+        One producer fetches each set's cards and queues the images still
+        to download; a pool of consumers downloads them.  The bounded queue
+        applies backpressure, and the next set's card data is fetched while
+        the previous set's images are still downloading.  Each set manifest
+        is written as soon as the last of its images finishes.
+
+        Returns (cards_by_set, images_ok, images_failed).
+        """
+        workers = self._downloader.concurrency
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 4)
+        state = self._state.state
+        sets_by_id = {s.id: s for s in all_sets}
+        all_cards: Dict[str, List[CardData]] = {}
+        remaining: Dict[str, int] = {}
+        image_tasks: Dict[str, TaskID] = {}
+        totals = {"ok": 0, "failed": 0}
+        sets_task = progress.add_task("Sets", total=len(all_sets))
+
+        async def produce() -> None:
+            for set_info in all_sets:
+                set_id = set_info.id
+                cards = await self._fetch_cards(set_id, force)
+                progress.advance(sets_task)
+                if not cards:
+                    continue
+
+                all_cards[set_id] = cards
+                state.mark_cards_scraped(set_id, (card.id for card in cards))
+                state.sets[set_id].last_scraped = datetime.now(timezone.utc).isoformat()
+
+                to_download = cards
+                if not force:
+                    to_download = [c for c in cards if not state.is_image_downloaded(set_id, c.id)]
+                if not to_download:
+                    self._write_set_manifest(set_info, cards)
+                    self._state.save()
+                    continue
+
+                remaining[set_id] = len(to_download)
+                image_tasks[set_id] = progress.add_task(f"[cyan]{set_id}", total=len(to_download))
+                existing = self._downloader.prefetch_existing(set_id)
+                for card in to_download:
+                    await queue.put((set_id, card, existing))
+
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                set_id, card, existing = item
+                url = self._get_best_image_url(card)
+                ok, _ = await self._downloader.download_card_image(card, url, existing)
+                if ok:
+                    state.mark_image(
+                        set_id, card.id, "success",
+                        path=self._downloader.image_location(set_id, card.id, url_extension(url)),
+                    )
+                    totals["ok"] += 1
+                else:
+                    state.mark_image(set_id, card.id, "failed")
+                    totals["failed"] += 1
+                progress.advance(image_tasks[set_id])
+
+                remaining[set_id] -= 1
+                if remaining[set_id] == 0:
+                    self._downloader.finish_set(set_id)
+                    self._write_set_manifest(sets_by_id[set_id], all_cards[set_id])
+                    self._state.save()
+
+        await _run_all([produce()] + [consume() for _ in range(workers)])
+        return all_cards, totals["ok"], totals["failed"]
+
+    def _write_set_manifest(self, set_info: SetInfo, cards: List[CardData]) -> None:
+        generate_set_manifest(
+            self._config.output.base_dir,
+            set_info,
+            cards,
+            version=self._config.output.manifest_version,
+            image_format=self._config.output.image_format,
+        )
+
     async def _discover_sets(self) -> List[SetInfo]:
         """Try each adapter in priority order to discover sets."""
         all_sets: Dict[str, SetInfo] = {}
@@ -271,3 +296,20 @@ def _instantiate_adapter(cls: type, cfg: SourceConfig) -> CardSourceAdapter:
         if "local_path" in params and cfg.local_path:
             kwargs["local_path"] = cfg.local_path
     return cls(**kwargs)
+
+
+async def _run_all(coros: List[Coroutine[Any, Any, None]]) -> None:
+    """Run coroutines concurrently; on the first failure cancel the rest.
+
+    A small stand-in for ``asyncio.TaskGroup``, which needs Python 3.11.
+    """
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from onepiece_scraper.models import CardImageStatus, ScrapeState, SetScrapeState
+from onepiece_scraper import _json
+from onepiece_scraper.models import ScrapeState, SetScrapeState
 
 logger = logging.getLogger(__name__)
 
+SAVE_INTERVAL = 5.0  # seconds between debounced saves
+
 
 class StateTracker:
     """Manages incremental scrape state backed by a JSON file."""
 
-    def __init__(self, state_file: str) -> None:
+    def __init__(self, state_file: str, save_interval: float = SAVE_INTERVAL) -> None:
         self._path = Path(state_file)
         self._state: Optional[ScrapeState] = None
+        self._save_interval = save_interval
+        self._last_save: Optional[float] = None
 
     @property
     def state(self) -> ScrapeState:
@@ -29,16 +35,31 @@ class StateTracker:
         """Clear all state (for --force mode)."""
         self._state = ScrapeState()
 
-    def save(self) -> None:
-        """Persist current state to disk."""
+    def save(self, force: bool = False) -> None:
+        """Persist current state to disk.
+
+        Each save rewrites the whole file, so calls made within
+        ``save_interval`` seconds of the previous write are skipped unless
+        ``force`` is set.  Call ``flush()`` once the scrape is done.
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_save is not None
+            and now - self._last_save < self._save_interval
+        ):
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        data = _serialize_state(self.state)
-        self._path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        # fsync before the rename: the state file is what a resumed run
+        # trusts, so it must never be left truncated by a crash.
+        _json.dump_file(self._path, _serialize_state(self.state), fsync=True)
+        self._last_save = now
         logger.debug("State saved to %s", self._path)
 
+    def flush(self) -> None:
+        """Write the current state now, regardless of the save interval."""
+        self.save(force=True)
+
     def delete(self) -> None:
         """Remove the state file."""
         if self._path.exists():
@@ -50,18 +71,8 @@ class StateTracker:
         """Return a human-readable summary of current state."""
         st = self.state
         total_cards = sum(len(ss.card_ids) for ss in st.sets.values())
-        total_images = sum(
-            1
-            for ss in st.sets.values()
-            for img in ss.images.values()
-            if img.status == "success"
-        )
-        failed_images = sum(
-            1
-            for ss in st.sets.values()
-            for img in ss.images.values()
-            if img.status == "failed"
-        )
+        total_images = sum(ss.images_ok for ss in st.sets.values())
+        failed_images = sum(ss.images_failed for ss in st.sets.values())
         return {
             "sets_scraped": len(st.sets),
             "total_cards": total_cards,
@@ -70,8 +81,8 @@ class StateTracker:
             "sets": {
                 sid: {
                     "cards": len(ss.card_ids),
-                    "images_ok": sum(1 for i in ss.images.values() if i.status == "success"),
-                    "images_failed": sum(1 for i in ss.images.values() if i.status == "failed"),
+                    "images_ok": ss.images_ok,
+                    "images_failed": ss.images_failed,
                     "last_scraped": ss.last_scraped,
                 }
                 for sid, ss in st.sets.items()
@@ -88,28 +99,32 @@ class StateTracker:
             return ScrapeState()
 
         try:
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            raw = _json.loads(self._path.read_bytes())
             return _deserialize_state(raw)
-        except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        except (ValueError, KeyError, TypeError) as exc:
+            # ValueError covers JSON decode errors from either codec and
+            # invalid UTF-8 (UnicodeDecodeError) from the stdlib one
             logger.warning("Corrupt state file %s: %s — starting fresh", self._path, exc)
             return ScrapeState()
 
 
 def _serialize_state(state: ScrapeState) -> Dict[str, Any]:
+    # On disk images stay one record per card, as before the in-memory
+    # state moved to per-field dicts.
     return {
         "sets": {
             sid: {
                 "set_id": ss.set_id,
                 "last_scraped": ss.last_scraped,
-                "card_ids": ss.card_ids,
+                "card_ids": sorted(ss.card_ids),
                 "images": {
                     cid: {
-                        "card_id": img.card_id,
-                        "status": img.status,
-                        "path": img.path,
-                        "error": img.error,
+                        "card_id": cid,
+                        "status": status,
+                        "path": ss.image_path.get(cid),
+                        "error": ss.image_error.get(cid),
                     }
-                    for cid, img in ss.images.items()
+                    for cid, status in ss.image_status.items()
                 },
             }
             for sid, ss in state.sets.items()
@@ -118,20 +133,25 @@ def _serialize_state(state: ScrapeState) -> Dict[str, Any]:
 
 
 def _deserialize_state(raw: Dict[str, Any]) -> ScrapeState:
-    state = ScrapeState()
-    for sid, ss_raw in raw.get("sets", {}).items():
-        images: Dict[str, CardImageStatus] = {}
-        for cid, img_raw in ss_raw.get("images", {}).items():
-            images[cid] = CardImageStatus(
-                card_id=img_raw["card_id"],
-                status=img_raw["status"],
-                path=img_raw.get("path"),
-                error=img_raw.get("error"),
-            )
-        state.sets[sid] = SetScrapeState(
-            set_id=ss_raw.get("set_id", sid),
-            last_scraped=ss_raw.get("last_scraped"),
-            card_ids=ss_raw.get("card_ids", []),
-            images=images,
-        )
-    return state
+    # Each dict is built by one comprehension rather than filled key by key.
+    return ScrapeState(sets={
+        sys.intern(sid): _deserialize_set(sys.intern(sid), ss_raw)
+        for sid, ss_raw in raw.get("sets", {}).items()
+    })
+
+
+def _deserialize_set(sid: str, ss_raw: Dict[str, Any]) -> SetScrapeState:
+    intern = sys.intern
+    images = {intern(cid): img_raw for cid, img_raw in ss_raw.get("images", {}).items()}
+    return SetScrapeState(
+        set_id=ss_raw.get("set_id", sid),
+        last_scraped=ss_raw.get("last_scraped"),
+        card_ids={intern(cid) for cid in ss_raw.get("card_ids", [])},
+        image_status={cid: intern(img["status"]) for cid, img in images.items()},
+        image_path={
+            cid: img["path"] for cid, img in images.items() if img.get("path") is not None
+        },
+        image_error={
+            cid: img["error"] for cid, img in images.items() if img.get("error") is not None
+        },
+    )
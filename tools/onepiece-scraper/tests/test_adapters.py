@@ -0,0 +1,35 @@
+"""Tests for the lazy adapter registry."""
+
+import subprocess
+import sys
+
+import pytest
+
+from onepiece_scraper.adapters import available_sources, get_adapter_class
+from onepiece_scraper.adapters.ryan_api import RyanApiAdapter
+from onepiece_scraper.config import KNOWN_SOURCES
+
+
+def test_get_adapter_class():
+    assert get_adapter_class("ryan-api") is RyanApiAdapter
+    with pytest.raises(ValueError, match="Unknown adapter 'nope'"):
+        get_adapter_class("nope")
+
+
+def test_registry_imports_adapters_on_demand():
+    code = (
+        "import sys\n"
+        "from onepiece_scraper.adapters import get_adapter_class\n"
+        "get_adapter_class('vegapull-records')\n"
+        "loaded = [m for m in sys.modules if m.startswith('onepiece_scraper.adapters.')]\n"
+        "print(sorted(loaded))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert "vegapull_records" in out.stdout
+    assert "optcg_api" not in out.stdout
+    assert "ryan_api" not in out.stdout
+
+
+def test_config_known_sources_follow_registry():
+    assert KNOWN_SOURCES == available_sources()
+    assert {"optcg-api", "ryan-api", "vegapull-records"} <= KNOWN_SOURCES
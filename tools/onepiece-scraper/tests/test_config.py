@@ -1,5 +1,7 @@
 """Tests for configuration loading and validation."""
 
+import json
+
 import pytest
 import yaml
 from pathlib import Path
@@ -81,6 +83,11 @@ def test_validate_config_unknown_source():
         })
 
 
+def test_validate_config_unknown_image_format():
+    with pytest.raises(ValueError, match="unknown image_format"):
+        _parse_config({"output": {"image_format": "zip"}})
+
+
 def test_validate_config_no_enabled():
     with pytest.raises(ValueError, match="no enabled sources"):
         _parse_config({
@@ -107,3 +114,67 @@ def test_load_config_from_file(tmp_path):
     config = load_config(cfg_path)
     assert len(config.sources) == 1
     assert config.sources[0].rate_limit_ms == 300
+
+
+def test_load_config_uses_sidecar_cache(tmp_path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(yaml.dump({"sources": [{"name": "optcg-api", "rate_limit_ms": 300}]}))
+    load_config(cfg_path)
+    cache_path = tmp_path / ".config.cache.json"
+    assert cache_path.exists()
+
+    # A matching cache entry is used instead of re-parsing the YAML
+    cached = json.loads(cache_path.read_text())
+    cached["raw"]["sources"][0]["rate_limit_ms"] = 999
+    cache_path.write_text(json.dumps(cached))
+    assert load_config(cfg_path).sources[0].rate_limit_ms == 999
+
+    # Editing the YAML invalidates it
+    cfg_path.write_text(yaml.dump({"sources": [{"name": "ryan-api", "rate_limit_ms": 450}]}))
+    config = load_config(cfg_path)
+    assert config.sources[0].name == "ryan-api"
+    assert config.sources[0].rate_limit_ms == 450
+
+
+def test_derived_properties_refresh_on_reassignment():
+    config = AppConfig(scrape=ScrapeConfig(sets="OP-01"))
+    assert config.set_filter == ["OP-01"]
+    assert config.set_filter is config.set_filter
+
+    config.scrape = ScrapeConfig(sets="OP-02,OP-03")
+    assert config.set_filter == ["OP-02", "OP-03"]
+
+    assert [s.name for s in config.enabled_sources][0] == "optcg-api"
+    config.sources = [SourceConfig(name="ryan-api")]
+    assert [s.name for s in config.enabled_sources] == ["ryan-api"]
+
+
+def test_section_configs_are_frozen():
+    config = AppConfig()
+    with pytest.raises(AttributeError):
+        config.output.base_dir = "/elsewhere"
+    assert not hasattr(config.sources[0], "__dict__")
+
+
+def test_parse_config_section_defaults():
+    config = _parse_config({
+        "sources": [{"name": "optcg-api", "unknown_key": 1}],
+        "output": {"image_format": "tar"},
+        "scrape": {"sets": 1},
+    })
+    assert config.sources[0].priority == 99
+    assert config.sources[0].rate_limit_ms == 200
+    assert config.output == OutputConfig(image_format="tar")
+    assert config.scrape.sets == "1"
+
+
+def test_validate_config_source_without_name():
+    with pytest.raises(ValueError, match="needs a 'name'"):
+        _parse_config({"sources": [{"priority": 1}]})
+
+
+def test_load_config_skips_cache_that_would_not_round_trip(tmp_path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("sources:\n  - name: optcg-api\nupdated: 2024-01-01\n")
+    assert load_config(cfg_path).sources[0].name == "optcg-api"
+    assert not (tmp_path / ".config.cache.json").exists()
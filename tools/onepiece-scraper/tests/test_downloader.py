@@ -0,0 +1,205 @@
+"""Tests for the image downloader with mocked HTTP responses."""
+
+import io
+import tarfile
+
+import pytest
+import httpx
+import respx
+
+from onepiece_scraper import downloader as downloader_mod
+from onepiece_scraper.downloader import ImageDownloader
+from onepiece_scraper.models import CardData
+
+IMAGE_HOST = "https://images.example.com"
+
+
+def _make_card(card_id: str = "OP01-001", set_id: str = "OP-01") -> CardData:
+    return CardData(
+        id=card_id,
+        name="Roronoa Zoro",
+        card_type="character",
+        cost=3,
+        power=5000,
+        counter=1000,
+        colors=("Red",),
+        rarity="SR",
+        traits=("Supernovas",),
+        text="",
+        life=None,
+        image_url=f"{IMAGE_HOST}/{card_id}.png",
+        set_id=set_id,
+        source="optcg-api",
+    )
+
+
+@pytest.fixture
+def mock_images():
+    with respx.mock(base_url=IMAGE_HOST) as rsps:
+        yield rsps
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(downloader_mod, "BACKOFF_BASE", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_download_card_image(tmp_path, mock_images):
+    mock_images.get("/OP01-001.png").mock(return_value=httpx.Response(200, content=b"PNGDATA"))
+    dl = ImageDownloader(str(tmp_path))
+    card = _make_card()
+
+    ok, error = await dl.download_card_image(card, card.image_url)
+    assert ok and error is None
+    dest = tmp_path / "OP-01" / "cards" / "OP01-001.png"
+    assert dest.read_bytes() == b"PNGDATA"
+    assert not dest.with_name("OP01-001.png.part").exists()
+    await dl.close()
+
+
+@pytest.mark.asyncio
+async def test_download_card_image_failure_leaves_no_partial(tmp_path, mock_images):
+    mock_images.get("/OP01-001.png").mock(return_value=httpx.Response(404))
+    dl = ImageDownloader(str(tmp_path), max_retries=2)
+    card = _make_card()
+
+    ok, error = await dl.download_card_image(card, card.image_url)
+    assert not ok
+    assert "2 attempts" in error
+    assert list((tmp_path / "OP-01" / "cards").iterdir()) == []
+    await dl.close()
+
+
+@pytest.mark.asyncio
+async def test_download_batch_counts(tmp_path, mock_images):
+    mock_images.get("/OP01-001.png").mock(return_value=httpx.Response(200, content=b"A"))
+    mock_images.get("/OP01-002.png").mock(return_value=httpx.Response(500))
+    dl = ImageDownloader(str(tmp_path), max_retries=1)
+    cards = [_make_card("OP01-001"), _make_card("OP01-002")]
+    progress = []
+
+    ok, fail = await dl.download_batch(
+        cards, get_url=lambda c: c.image_url, progress_callback=lambda: progress.append(1),
+    )
+    assert (ok, fail) == (1, 1)
+    assert len(progress) == 2
+    await dl.close()
+
+
+def test_prefetch_existing(tmp_path):
+    dl = ImageDownloader(str(tmp_path))
+    assert dl.prefetch_existing("OP-01") == set()
+
+    cards_dir = tmp_path / "OP-01" / "cards"
+    cards_dir.mkdir(parents=True)
+    (cards_dir / "OP01-001.png").write_bytes(b"A")
+    assert dl.prefetch_existing("OP-01") == {"OP01-001.png"}
+
+
+@pytest.mark.asyncio
+async def test_download_card_image_skips_existing(tmp_path, mock_images):
+    # No route registered: any request would fail the download
+    dl = ImageDownloader(str(tmp_path), max_retries=1)
+    card = _make_card()
+
+    ok, error = await dl.download_card_image(card, card.image_url, existing={"OP01-001.png"})
+    assert ok and error is None
+    assert not mock_images.calls
+    await dl.close()
+
+
+@pytest.mark.asyncio
+async def test_download_into_tar(tmp_path, mock_images):
+    mock_images.get("/OP01-001.png").mock(return_value=httpx.Response(200, content=b"A"))
+    mock_images.get("/OP01-002.png").mock(return_value=httpx.Response(200, content=b"BB"))
+    dl = ImageDownloader(str(tmp_path), image_format="tar")
+    cards = [_make_card("OP01-001")]
+
+    assert await dl.download_batch(cards, get_url=lambda c: c.image_url) == (1, 0)
+    assert dl.image_exists("OP-01", "OP01-001", "png")
+    assert not (tmp_path / "OP-01" / "cards").exists()
+    await dl.close()
+
+    # A later run appends to the archive and skips members already in it
+    dl = ImageDownloader(str(tmp_path), image_format="tar")
+    assert dl.prefetch_existing("OP-01") == {"OP01-001.png"}
+    cards.append(_make_card("OP01-002"))
+    assert await dl.download_batch(cards, get_url=lambda c: c.image_url) == (2, 0)
+    assert dl.image_location("OP-01", "OP01-002", "png").endswith("cards.tar#OP01-002.png")
+    await dl.close()
+
+    with tarfile.open(tmp_path / "OP-01" / "cards.tar") as tar:
+        assert tar.getnames() == ["OP01-001.png", "OP01-002.png"]
+        assert tar.extractfile("OP01-002.png").read() == b"BB"
+    assert mock_images.get("/OP01-001.png").call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_finish_set_closes_archive(tmp_path, mock_images):
+    mock_images.get("/OP01-001.png").mock(return_value=httpx.Response(200, content=b"A"))
+    dl = ImageDownloader(str(tmp_path), image_format="tar")
+    await dl.download_card_image(_make_card(), f"{IMAGE_HOST}/OP01-001.png")
+    dl.finish_set("OP-01")
+
+    with tarfile.open(tmp_path / "OP-01" / "cards.tar") as tar:
+        assert tar.getnames() == ["OP01-001.png"]
+    await dl.close()
+
+
+def test_damaged_archive_is_truncated_to_intact_members(tmp_path):
+    archive = tmp_path / "OP-01" / "cards.tar"
+    archive.parent.mkdir()
+    with tarfile.open(archive, "w") as tar:
+        for name, data in (("OP01-001.png", b"A" * 600), ("OP01-002.png", b"B" * 600)):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    # Cut the second member's data short, as a killed run would
+    archive.write_bytes(archive.read_bytes()[:2048 + 512 + 100])
+
+    dl = ImageDownloader(str(tmp_path), image_format="tar")
+    assert dl.prefetch_existing("OP-01") == {"OP01-001.png"}
+    with tarfile.open(archive) as tar:
+        assert tar.getnames() == ["OP01-001.png"]
+    tarfile.open(archive, "a").close()  # append mode accepts the repaired file
+
+
+@pytest.mark.asyncio
+async def test_download_follows_redirects(tmp_path, mock_images):
+    mock_images.get("/OP01-001.png").mock(
+        return_value=httpx.Response(302, headers={"Location": f"{IMAGE_HOST}/cdn/OP01-001.png"}),
+    )
+    mock_images.get("/cdn/OP01-001.png").mock(return_value=httpx.Response(200, content=b"PNG"))
+    dl = ImageDownloader(str(tmp_path))
+    card = _make_card()
+
+    ok, _ = await dl.download_card_image(card, card.image_url)
+    assert ok
+    assert (tmp_path / "OP-01" / "cards" / "OP01-001.png").read_bytes() == b"PNG"
+    await dl.close()
+
+
+@pytest.mark.asyncio
+async def test_partial_trailing_header_is_truncated(tmp_path, mock_images):
+    mock_images.get("/OP01-002.png").mock(return_value=httpx.Response(200, content=b"B"))
+    archive = tmp_path / "OP-01" / "cards.tar"
+    archive.parent.mkdir()
+    with tarfile.open(archive, "w") as tar:
+        info = tarfile.TarInfo("OP01-001.png")
+        info.size = 1
+        tar.addfile(info, io.BytesIO(b"A"))
+    # Drop the end-of-archive blocks and leave half a header, as a run
+    # killed while writing the next member's header would
+    partial = tarfile.TarInfo("OP01-002.png").tobuf()[:200]
+    archive.write_bytes(archive.read_bytes()[:1024] + partial)
+
+    dl = ImageDownloader(str(tmp_path), image_format="tar")
+    assert dl.prefetch_existing("OP-01") == {"OP01-001.png"}
+    assert archive.read_bytes()[1024:] == b"\0" * 1024
+    ok, _ = await dl.download_card_image(_make_card("OP01-002"), f"{IMAGE_HOST}/OP01-002.png")
+    assert ok
+    await dl.close()
+
+    with tarfile.open(archive) as tar:
+        assert tar.getnames() == ["OP01-001.png", "OP01-002.png"]
@@ -0,0 +1,62 @@
+"""Tests for shared HTTP helpers."""
+
+import asyncio
+import time
+
+import pytest
+
+from onepiece_scraper.http import RateLimiter, close_shared_client, pool_limits, shared_client
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reused_until_closed():
+    client = shared_client()
+    assert shared_client() is client
+    await close_shared_client()
+    assert client.is_closed
+    assert shared_client() is not client
+    await close_shared_client()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_first_request_not_delayed():
+    limiter = RateLimiter(0.5)
+    start = time.monotonic()
+    async with limiter:
+        pass
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_concurrent_requests():
+    limiter = RateLimiter(0.05)
+    stamps = []
+
+    async def request():
+        async with limiter:
+            stamps.append(time.monotonic())
+
+    await asyncio.gather(*(request() for _ in range(4)))
+    assert stamps[-1] - stamps[0] >= 3 * 0.05 - 0.01
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_disabled():
+    limiter = RateLimiter(0)
+    start = time.monotonic()
+    for _ in range(100):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+def test_pool_limits_scale_with_concurrency():
+    limits = pool_limits(3)
+    assert limits.max_keepalive_connections == 3
+    assert limits.max_connections == 6
+
+
+@pytest.mark.asyncio
+async def test_shared_client_does_not_follow_redirects():
+    # Only image downloads opt in, per request
+    assert not shared_client().follow_redirects
+    await close_shared_client()
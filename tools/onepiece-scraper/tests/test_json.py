@@ -0,0 +1,37 @@
+"""Tests for the JSON codec shim."""
+
+import pytest
+
+from onepiece_scraper import _json
+
+
+@pytest.mark.asyncio
+async def test_loads_async_small_and_large():
+    assert await _json.loads_async(b'{"id": "OP01-001"}') == {"id": "OP01-001"}
+
+    cards = [{"id": f"OP01-{i:03d}", "text": "x" * 100} for i in range(1000)]
+    body = _json.dumps_pretty(cards)
+    assert len(body) > _json.OFFLOAD_THRESHOLD
+    assert await _json.loads_async(body) == cards
+
+
+def test_dump_file_replaces_atomically(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_bytes(b"old")
+    _json.dump_file(path, {"sets": {}}, fsync=True)
+    assert _json.loads(path.read_bytes()) == {"sets": {}}
+    assert not (tmp_path / "state.json.tmp").exists()
+
+
+def test_dump_file_failure_removes_tmp(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    path.write_bytes(b"old")
+
+    def fail(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(_json.os, "write", fail)
+    with pytest.raises(OSError, match="disk full"):
+        _json.dump_file(path, {"sets": {}})
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 
 from onepiece_scraper.manifest import (
+    _build_metadata,
+    _metadata_builder,
     generate_root_manifest,
     generate_set_manifest,
     validate_manifest,
@@ -19,9 +21,9 @@ def _make_card(card_id: str = "OP01-001", **overrides) -> CardData:
         cost=3,
         power=5000,
         counter=1000,
-        colors=["Red"],
+        colors=("Red",),
         rarity="SR",
-        traits=["Supernovas", "Straw Hat Crew"],
+        traits=("Supernovas", "Straw Hat Crew"),
         text="Rush",
         life=None,
         image_url="https://example.com/OP01-001.jpg",
@@ -66,8 +68,8 @@ def test_generate_set_manifest(tmp_path):
     assert result["cards"][0]["metadata"]["cardType"] == "character"
     assert result["cards"][0]["metadata"]["cost"] == 3
     assert result["cards"][0]["metadata"]["power"] == 5000
-    assert result["cards"][0]["metadata"]["colors"] == ["Red"]
-    assert result["cards"][0]["metadata"]["traits"] == ["Supernovas", "Straw Hat Crew"]
+    assert result["cards"][0]["metadata"]["colors"] == ("Red",)
+    assert result["cards"][0]["metadata"]["traits"] == ("Supernovas", "Straw Hat Crew")
     assert result["cards"][0]["metadata"]["counter"] == 1000
 
     # File was written
@@ -75,6 +77,23 @@ def test_generate_set_manifest(tmp_path):
     assert manifest_path.exists()
 
 
+def test_generate_set_manifest_rewrite_is_atomic(tmp_path):
+    set_info = SetInfo(id="OP-01", name="Romance Dawn", category="booster")
+    generate_set_manifest(str(tmp_path), set_info, [_make_card("OP01-001")])
+    generate_set_manifest(str(tmp_path), set_info, [_make_card("OP01-002", name="Monkey D. Luffy")])
+
+    set_dir = tmp_path / "OP-01"
+    data = json.loads((set_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert [c["id"] for c in data["cards"]] == ["OP01-002"]
+    assert [p.name for p in set_dir.iterdir()] == ["manifest.json"]
+
+
+def test_generate_set_manifest_tar_format(tmp_path):
+    set_info = SetInfo(id="OP-01", name="Romance Dawn", category="booster")
+    result = generate_set_manifest(str(tmp_path), set_info, [_make_card()], image_format="tar")
+    assert result["cards"][0]["front"] == "cards.tar#OP01-001.jpg"
+
+
 def test_generate_set_manifest_leader(tmp_path):
     """Leader cards should include life in metadata."""
     set_info = SetInfo(id="OP-01", name="Romance Dawn", category="booster")
@@ -92,6 +111,17 @@ def test_generate_set_manifest_leader(tmp_path):
     assert "counter" not in meta
 
 
+def test_compiled_metadata_builder_matches_reference():
+    cards = [
+        _make_card(),
+        _make_card(card_type="leader", cost=0, power=None, counter=None, life=5),
+        _make_card(colors=(), traits=(), text="", rarity=""),
+    ]
+    for card in cards:
+        assert _metadata_builder(card) == _build_metadata(card)
+        assert list(_metadata_builder(card)) == list(_build_metadata(card))
+
+
 def test_validate_manifest_valid():
     manifest = {
         "name": "Test",
@@ -129,6 +159,32 @@ def test_validate_manifest_duplicate_card_id():
     assert any("duplicate" in e for e in errors)
 
 
+def test_validate_manifest_duplicate_reports_first_repeat_and_count():
+    manifest = {
+        "name": "T",
+        "version": "1.0",
+        "game": "onepiece",
+        "cards": [
+            {"id": "OP01-001", "name": "A", "front": "a.jpg"},
+            {"id": "OP01-002", "name": "B", "front": "b.jpg"},
+            {"id": "OP01-001", "name": "C", "front": "c.jpg"},
+            {"id": "OP01-001", "name": "D", "front": "d.jpg"},
+        ],
+    }
+    errors = validate_manifest(manifest)
+    assert errors == ["cards[2]: duplicate id 'OP01-001' (3 entries)"]
+
+
+def test_validate_manifest_reports_all_missing_card_fields():
+    manifest = {"name": "T", "version": "1.0", "game": "onepiece", "cards": [{}]}
+    errors = validate_manifest(manifest)
+    assert errors == [
+        "cards[0]: missing 'id'",
+        "cards[0]: missing 'name'",
+        "cards[0]: missing 'front'",
+    ]
+
+
 def test_validate_manifest_card_missing_id():
     manifest = {
         "name": "T",
@@ -1,5 +1,10 @@
 """Tests for data models."""
 
+import dataclasses
+import sys
+
+import pytest
+
 from onepiece_scraper.models import CardData, CardImageStatus, ScrapeState, SetInfo, SetScrapeState
 
 
@@ -10,6 +15,14 @@ def test_set_info_creation():
     assert s.category == "booster"
 
 
+def test_set_info_is_frozen_and_hashable():
+    a = SetInfo(id="OP-01", name="Romance Dawn", category="booster")
+    b = SetInfo(id="OP-01", name="Romance Dawn", category="booster")
+    assert {a, b} == {a}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.name = "Paramount War"
+
+
 def test_card_data_creation():
     card = CardData(
         id="OP01-001",
@@ -18,9 +31,9 @@ def test_card_data_creation():
         cost=3,
         power=5000,
         counter=1000,
-        colors=["Red"],
+        colors=("Red",),
         rarity="SR",
-        traits=["Supernovas", "Straw Hat Crew"],
+        traits=("Supernovas", "Straw Hat Crew"),
         text="Rush",
         life=None,
         image_url="https://example.com/OP01-001.jpg",
@@ -28,7 +41,7 @@ def test_card_data_creation():
         source="optcg-api",
     )
     assert card.id == "OP01-001"
-    assert card.colors == ["Red"]
+    assert card.colors == ("Red",)
     assert card.life is None
 
 
@@ -60,3 +73,50 @@ def test_scrape_state_empty():
     state = ScrapeState()
     assert not state.is_card_scraped("OP-01", "OP01-001")
     assert not state.is_image_downloaded("OP-01", "OP01-001")
+
+
+def test_scrape_state_interns_ids_and_status():
+    state = ScrapeState()
+    status = "".join(["suc", "cess"])  # a fresh, non-interned string
+    state.mark_image("".join(["OP", "-01"]), "OP01-001", status)
+    assert state.sets["OP-01"].image_status["OP01-001"] is sys.intern("success")
+    assert next(iter(state.sets)) is sys.intern("OP-01")
+
+
+def test_scrape_state_image_columns():
+    state = ScrapeState()
+    state.mark_image("OP-01", "OP01-001", "failed", error="404")
+    ss = state.sets["OP-01"]
+    assert ss.image("OP01-001") == CardImageStatus("OP01-001", "failed", None, "404")
+    assert ss.image_path == {}
+
+    state.mark_image("OP-01", "OP01-001", "success", path="/out/OP01-001.jpg")
+    assert ss.image_status == {"OP01-001": "success"}
+    assert ss.image_path == {"OP01-001": "/out/OP01-001.jpg"}
+    assert ss.image_error == {}
+    assert ss.image("OP01-999") is None
+
+
+def test_scrape_state_image_counters():
+    state = ScrapeState()
+    state.mark_image("OP-01", "OP01-001", "failed", error="404")
+    state.mark_image("OP-01", "OP01-002", "success")
+    ss = state.sets["OP-01"]
+    assert (ss.images_ok, ss.images_failed) == (1, 1)
+
+    # Re-marking moves the card between counters rather than adding to both
+    state.mark_image("OP-01", "OP01-001", "success")
+    assert (ss.images_ok, ss.images_failed) == (2, 0)
+
+
+def test_scrape_state_mark_cards_scraped():
+    state = ScrapeState()
+    state.mark_cards_scraped("OP-01", ["OP01-001", "OP01-002"])
+    state.mark_cards_scraped("OP-01", iter(["OP01-002", "OP01-003"]))
+    assert state.sets["OP-01"].card_ids == {"OP01-001", "OP01-002", "OP01-003"}
+
+
+def test_set_scrape_state_counts_images_at_construction():
+    ss = SetScrapeState(set_id="OP-01", image_status={"OP01-001": "success", "OP01-002": "failed"})
+    assert (ss.images_ok, ss.images_failed) == (1, 1)
+    assert ss == SetScrapeState(set_id="OP-01", image_status=dict(ss.image_status))
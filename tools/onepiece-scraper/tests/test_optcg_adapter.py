@@ -67,9 +67,9 @@ async def test_get_cards(adapter, mock_api):
     assert c.cost == 3
     assert c.power == 5000
     assert c.counter == 1000
-    assert c.colors == ["Red"]
+    assert c.colors == ("Red",)
     assert c.rarity == "SR"
-    assert c.traits == ["Supernovas", "Straw Hat Crew"]
+    assert c.traits == ("Supernovas", "Straw Hat Crew")
     assert c.text == "Rush"
     assert c.life is None
     assert "OP01-001" in c.image_url
@@ -100,7 +100,7 @@ async def test_get_cards_multicolor(adapter, mock_api):
     ))
 
     cards = await adapter.get_cards("OP-01")
-    assert cards[0].colors == ["Red", "Green"]
+    assert cards[0].colors == ("Red", "Green")
     await adapter.close()
 
 
@@ -187,9 +187,9 @@ async def test_get_image_url(adapter):
         cost=1,
         power=1000,
         counter=None,
-        colors=["Red"],
+        colors=("Red",),
         rarity="C",
-        traits=[],
+        traits=(),
         text="",
         life=None,
         image_url="",
@@ -71,8 +71,8 @@ async def test_get_cards(adapter, mock_api):
     assert c.cost == 3
     assert c.power == 5000
     assert c.counter == 1000
-    assert c.colors == ["Red"]
-    assert c.traits == ["Supernovas", "Straw Hat Crew"]
+    assert c.colors == ("Red",)
+    assert c.traits == ("Supernovas", "Straw Hat Crew")
     assert c.text == "Rush"
     assert c.source == "ryan-api"
     await adapter.close()
@@ -0,0 +1,112 @@
+"""Tests for the scrape pipeline with a fake adapter and mocked image host."""
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from onepiece_scraper import downloader as downloader_mod
+from onepiece_scraper.config import AppConfig, OutputConfig, ScrapeConfig, StateConfig
+from onepiece_scraper.models import CardData, SetInfo
+from onepiece_scraper.scraper import Scraper
+
+IMAGE_HOST = "https://images.example.com"
+
+
+class FakeAdapter:
+    name = "fake"
+
+    def __init__(self, cards_by_set):
+        self._cards_by_set = cards_by_set
+
+    async def list_sets(self):
+        return [SetInfo(id=sid, name=f"Set {sid}", category="booster") for sid in self._cards_by_set]
+
+    async def get_cards(self, set_id):
+        return list(self._cards_by_set.get(set_id, []))
+
+    def get_image_url(self, card):
+        return card.image_url
+
+    async def close(self):
+        pass
+
+
+def _make_card(card_id: str, set_id: str) -> CardData:
+    return CardData(
+        id=card_id, name=card_id, card_type="character", cost=1, power=1000, counter=None,
+        colors=("Red",), rarity="C", traits=(), text="", life=None,
+        image_url=f"{IMAGE_HOST}/{card_id}.png", set_id=set_id, source="fake",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(downloader_mod, "BACKOFF_BASE", 0.0)
+
+
+def _scraper(tmp_path, cards_by_set):
+    config = AppConfig(
+        output=OutputConfig(base_dir=str(tmp_path / "out")),
+        scrape=ScrapeConfig(include_starters=False, include_promos=False),
+        state=StateConfig(state_file=str(tmp_path / "state.json")),
+    )
+    scraper = Scraper(config)
+    scraper._adapters = [FakeAdapter(cards_by_set)]
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_run_downloads_images_and_writes_manifests(tmp_path):
+    cards_by_set = {
+        "OP-01": [_make_card(f"OP01-{i:03d}", "OP-01") for i in range(1, 13)],
+        "OP-02": [_make_card("OP02-001", "OP-02"), _make_card("OP02-002", "OP-02")],
+    }
+    scraper = _scraper(tmp_path, cards_by_set)
+    with respx.mock(base_url=IMAGE_HOST) as rsps:
+        rsps.get("/OP02-002.png").mock(return_value=httpx.Response(404))
+        rsps.get(url__regex=r".*\.png$").mock(return_value=httpx.Response(200, content=b"IMG"))
+        await scraper.run()
+    await scraper.teardown()
+
+    out = tmp_path / "out"
+    root = json.loads((out / "manifest.json").read_text())
+    assert [s["path"] for s in root["sets"]] == ["OP-01", "OP-02"]
+    set_manifest = json.loads((out / "OP-01" / "manifest.json").read_text())
+    assert len(set_manifest["cards"]) == 12
+    assert (out / "OP-01" / "cards" / "OP01-012.png").read_bytes() == b"IMG"
+
+    state = scraper._state.state
+    assert state.is_image_downloaded("OP-01", "OP01-001")
+    assert state.sets["OP-01"].image_path["OP01-001"].endswith("OP01-001.png")
+    assert state.is_image_downloaded("OP-02", "OP02-001")
+    assert not state.is_image_downloaded("OP-02", "OP02-002")
+
+
+@pytest.mark.asyncio
+async def test_run_skips_sets_already_downloaded(tmp_path):
+    cards_by_set = {"OP-01": [_make_card("OP01-001", "OP-01")]}
+    scraper = _scraper(tmp_path, cards_by_set)
+    scraper._state.state.mark_image("OP-01", "OP01-001", "success")
+
+    # No routes: any image request would fail the run's download count
+    with respx.mock(base_url=IMAGE_HOST) as rsps:
+        await scraper.run()
+        assert not rsps.calls
+    await scraper.teardown()
+
+    assert (tmp_path / "out" / "OP-01" / "manifest.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_failure_cancels_workers(tmp_path, monkeypatch):
+    scraper = _scraper(tmp_path, {"OP-01": [_make_card("OP01-001", "OP-01")]})
+
+    async def boom(set_id, force):
+        raise RuntimeError("adapter exploded")
+
+    monkeypatch.setattr(scraper, "_fetch_cards", boom)
+    with pytest.raises(RuntimeError, match="adapter exploded"):
+        await scraper.run()
+    await scraper.teardown()
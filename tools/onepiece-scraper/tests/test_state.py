@@ -68,6 +68,18 @@ def test_state_tracker_summary(tmp_path):
     assert summary["sets"]["OP-01"]["cards"] == 2
 
 
+def test_state_tracker_summary_after_load(tmp_path):
+    path = str(tmp_path / "state.json")
+    tracker = StateTracker(path)
+    tracker.state.mark_image("OP-01", "OP01-001", "success")
+    tracker.state.mark_image("OP-01", "OP01-002", "failed")
+    tracker.save()
+
+    summary = StateTracker(path).summary()
+    assert summary["images_downloaded"] == 1
+    assert summary["images_failed"] == 1
+
+
 def test_state_tracker_corrupt_file(tmp_path):
     state_file = tmp_path / "state.json"
     state_file.write_text("not valid json {{{")
@@ -89,3 +101,31 @@ def test_state_file_is_human_readable(tmp_path):
     assert "OP-01" in raw["sets"]
     assert "card_ids" in raw["sets"]["OP-01"]
     assert "images" in raw["sets"]["OP-01"]
+
+
+def test_card_ids_round_trip_as_sorted_list(tmp_path):
+    state_file = tmp_path / "state.json"
+    tracker = StateTracker(str(state_file))
+    for cid in ("OP01-003", "OP01-001", "OP01-002"):
+        tracker.state.mark_card_scraped("OP-01", cid)
+    tracker.save()
+
+    raw = json.loads(state_file.read_text())
+    assert raw["sets"]["OP-01"]["card_ids"] == ["OP01-001", "OP01-002", "OP01-003"]
+
+    reloaded = StateTracker(str(state_file)).state
+    assert reloaded.sets["OP-01"].card_ids == {"OP01-001", "OP01-002", "OP01-003"}
+    assert reloaded.is_card_scraped("OP-01", "OP01-002")
+
+
+def test_state_tracker_debounced_save(tmp_path):
+    state_file = tmp_path / "state.json"
+    tracker = StateTracker(str(state_file), save_interval=3600)
+    tracker.save()
+    tracker.state.mark_card_scraped("OP-01", "OP01-001")
+
+    tracker.save()  # within the interval: skipped
+    assert "OP01-001" not in state_file.read_text()
+
+    tracker.flush()
+    assert "OP01-001" in state_file.read_text()
@@ -0,0 +1,22 @@
+"""Tests for URL helpers."""
+
+import pytest
+
+from onepiece_scraper._urls import url_extension
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com/cards/OP01-001.png", "png"),
+        ("https://example.com/cards/OP01-001.JPEG?v=2", "jpeg"),
+        ("https://example.com/cards/OP01-001.webp#front", "webp"),
+        ("https://example.com/cards/OP01-001", "jpg"),
+        ("https://example.com/img.png/OP01-001", "jpg"),
+        ("https://example.com/image?file=OP01-001.png", "jpg"),
+        ("https://example.com/cards/OP01-001.bmp", "jpg"),
+        ("", "jpg"),
+    ],
+)
+def test_url_extension(url, expected):
+    assert url_extension(url) == expected
@@ -0,0 +1,59 @@
+"""Tests for the vegapull-records adapter reading local JSON files."""
+
+import json
+
+import pytest
+
+from onepiece_scraper.adapters.vegapull_records import VegapullRecordsAdapter
+
+
+@pytest.fixture
+def records_dir(tmp_path):
+    (tmp_path / "op01.json").write_text(json.dumps([
+        {
+            "card_id": "OP01-001",
+            "card_name": "Roronoa Zoro",
+            "card_type": "Leader",
+            "card_color": "Red/Green",
+            "card_power": "5000",
+            "life": 5,
+            "sub_types": ["Supernovas", "Straw Hat Crew"],
+            "card_text": "[DON!! x1] ...",
+            "rarity": "L",
+        },
+        {"code": "OP01-002", "name": "Trafalgar Law", "cost": "", "class": "Heart Pirates"},
+    ]))
+    (tmp_path / "broken.json").write_text("{not json")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_list_sets(records_dir):
+    sets = await VegapullRecordsAdapter(str(records_dir)).list_sets()
+    assert [(s.id, s.category) for s in sets] == [("OP-01", "booster")]
+
+
+@pytest.mark.asyncio
+async def test_get_cards_uses_alternate_keys(records_dir):
+    cards = await VegapullRecordsAdapter(str(records_dir)).get_cards("OP-01")
+    assert [c.id for c in cards] == ["OP01-001", "OP01-002"]
+
+    leader, law = cards
+    assert leader.name == "Roronoa Zoro"
+    assert leader.card_type == "leader"
+    assert leader.colors == ("Red", "Green")
+    assert leader.power == 5000
+    assert leader.life == 5
+    assert leader.traits == ("Supernovas", "Straw Hat Crew")
+    assert leader.set_id == "OP-01"
+    assert law.cost is None
+    assert law.traits == ("Heart Pirates",)
+    assert law.source == "vegapull-records"
+
+
+def test_parsed_colors_and_traits_are_shared(tmp_path):
+    adapter = VegapullRecordsAdapter(str(tmp_path))
+    a = adapter._parse_card({"code": "OP01-001", "color": "Red", "traits": ["Supernovas"]}, "OP-01")
+    b = adapter._parse_card({"code": "OP01-002", "color": "Red", "traits": ["Supernovas"]}, "OP-01")
+    assert a.colors is b.colors
+    assert a.traits is b.traits